@@ -1,57 +1,53 @@
 # cogs/admin_cog.py
 from __future__ import annotations
 
-import json
-from typing import Any, Mapping, Optional
+from typing import Any, Mapping
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from db.pool import DbPool
 from repositories.identity_repo import IdentityRepo
 from renderers.embeds import Embeds
-
-
-def _json_obj(v: Any) -> dict:
-    if v is None:
-        return {}
-    if isinstance(v, dict):
-        return v
-    if isinstance(v, str):
-        try:
-            return json.loads(v)
-        except Exception:
-            return {}
-    return {}
+from utils.cache import TTLCache
+from utils.json_util import json_dumps
 
 
 class AdminCog(commands.Cog):
     admin = app_commands.Group(name="admin", description="Admin configuration (D2 Hustlers bot).")
 
-    def __init__(self, bot: commands.Bot, *, identity_repo: IdentityRepo, embeds: Embeds) -> None:
+    def __init__(
+        self,
+        bot: commands.Bot,
+        *,
+        db: DbPool,
+        identity_repo: IdentityRepo,
+        embeds: Embeds,
+        settings_cache: TTLCache,
+    ) -> None:
         self.bot = bot
+        self.db = db
         self.identity_repo = identity_repo
         self.embeds = embeds
+        # guild_channel_id -> announce settings (shared with EventsCog)
+        self.settings_cache = settings_cache
 
     async def _ensure_guild_channel_id(self, guild: discord.Guild) -> int:
         return await self.identity_repo.ensure_discord_guild(guild_id=guild.id, guild_name=guild.name)
 
-    async def _get_guild_row(self, guild_channel_id: int) -> Optional[Mapping[str, Any]]:
-        return await self.identity_repo.fetch_one(
-            "SELECT channel_id, metadata FROM channel WHERE channel_id=%s;",
-            (guild_channel_id,),
-        )
+    async def _get_guild_settings(self, guild_channel_id: int) -> Mapping[str, Any]:
+        settings = self.settings_cache.get(guild_channel_id)
+        if settings is None:
+            row = await self.identity_repo.get_guild_announce_settings(guild_channel_id=guild_channel_id)
+            settings = dict(row) if row else {}
+            self.settings_cache.set(guild_channel_id, settings)
+        return settings
 
     async def _set_guild_metadata_patch(self, guild_channel_id: int, patch: Mapping[str, Any]) -> None:
-        patch_json = json.dumps(patch, separators=(",", ":"), ensure_ascii=False)
-        await self.identity_repo.execute(
-            """
-            UPDATE channel
-            SET metadata = JSON_MERGE_PATCH(COALESCE(metadata, JSON_OBJECT()), %s)
-            WHERE channel_id=%s;
-            """,
-            (patch_json, guild_channel_id),
-        )
+        patch_json = json_dumps(patch)
+        await self.identity_repo.merge_channel_metadata(channel_id=guild_channel_id, patch_json=patch_json)
+        self.settings_cache.invalidate(guild_channel_id)
 
     @admin.command(name="set_announce_channel", description="Set the default announce channel for events in this server.")
     @app_commands.describe(channel="The channel to post event announcements / bracket updates.")
@@ -92,23 +88,43 @@ class AdminCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         guild_channel_id = await self._ensure_guild_channel_id(interaction.guild)
-        row = await self._get_guild_row(guild_channel_id)
-        md = _json_obj(row["metadata"]) if row else {}
+        settings = await self._get_guild_settings(guild_channel_id)
 
-        announce_internal = md.get("announce_channel_id")
-        announce_discord = md.get("announce_discord_id")
+        announce_internal = settings.get("announce_channel_id")
+        announce_discord = settings.get("announce_discord_id")
 
-        desc = []
         if announce_discord:
-            desc.append(f"**Announce channel:** <#{announce_discord}>")
+            desc = f"**Announce channel:** <#{announce_discord}>"
         elif announce_internal:
-            desc.append(f"**Announce channel:** (configured internally: {announce_internal})")
+            desc = f"**Announce channel:** (configured internally: {announce_internal})"
         else:
-            desc.append("**Announce channel:** (not set)")
+            desc = "**Announce channel:** (not set)"
 
-        e = self.embeds.info(title="Guild Settings", description="\n".join(desc))
+        e = self.embeds.info(title="Guild Settings", description=desc)
         await interaction.followup.send(embed=e, ephemeral=True)
 
+    @admin.command(name="pool_stats", description="Show database connection pool usage.")
+    async def pool_stats(self, interaction: discord.Interaction) -> None:
+        if not interaction.guild:
+            await interaction.response.send_message("This command must be used in a server.", ephemeral=True)
+            return
 
-async def setup(bot: commands.Bot, *, identity_repo: IdentityRepo, embeds: Embeds) -> None:
-    await bot.add_cog(AdminCog(bot, identity_repo=identity_repo, embeds=embeds))
+        st = self.db.stats()
+        desc = (
+            f"**In use:** {st['in_use']} / {st['size']} open\n"
+            f"**Free:** {st['free']}\n"
+            f"**Waiting:** {st['waiting']}\n"
+            f"**Limits:** min {st['minsize']} · max {st['maxsize']}"
+        )
+        await interaction.response.send_message(embed=self.embeds.info(title="DB Pool", description=desc), ephemeral=True)
+
+
+async def setup(
+    bot: commands.Bot,
+    *,
+    db: DbPool,
+    identity_repo: IdentityRepo,
+    embeds: Embeds,
+    settings_cache: TTLCache,
+) -> None:
+    await bot.add_cog(AdminCog(bot, db=db, identity_repo=identity_repo, embeds=embeds, settings_cache=settings_cache))
@@ -2,43 +2,111 @@
 from __future__ import annotations
 
 import os
-import json
 import random
-import time
 import asyncio
+import logging
 
-
-
+import aiomysql
 import discord
 from discord import app_commands
 from discord.ext import commands
 
 from pathlib import Path
 from io import BytesIO
-from typing import Any, Mapping, Optional
+from typing import Any, Callable, Mapping, Optional
+from time import monotonic as _monotonic
 
+from domain.event_meta import EventMeta
 from repositories.identity_repo import IdentityRepo
 from repositories.event_repo import EventRepo
-from services.bracket_service import BracketService
+from services.bracket_service import BracketService, BracketStateError, parse_match_code
 from services.stats_service import StatsService
 from renderers.embeds import Embeds
 from renderers.bracket_view import BracketView
 from renderers.leaderboard_view import LeaderboardView, LeaderboardOptions
-from renderers.bracket_diagram import BracketDiagramRenderer
+from renderers.bracket_diagram import MATCH_COLUMNS, BracketDiagramRenderer
 from renderers.spin_reveal import SpinRevealRenderer
+from utils.async_ttl_cache import AsyncTTLCache
+from utils.cache import TTLCache
+
+log = logging.getLogger(__name__)
+
+
+def _join_bounded(parts: Any, *, sep: str = " + ", limit: int = 128) -> str:
+    """
+    sep.join(parts)[:limit] without building the parts past the limit.
+    """
+    buf: list[str] = []
+    total = 0
+    for p in parts:
+        if buf:
+            total += len(sep)
+        buf.append(p)
+        total += len(p)
+        if total >= limit:
+            break
+    return sep.join(buf)[:limit]
+
+
+def _is_duplicate_key(exc: aiomysql.IntegrityError, key_name: str) -> bool:
+    # ER_DUP_ENTRY (1062): "Duplicate entry '...' for key 'table.key_name'"
+    args = exc.args
+    return bool(args) and args[0] == 1062 and key_name in str(args[1] if len(args) > 1 else "")
+
+
+# Commands considered "heavy" (rate-limited in EventsCog._rate_limit_heavy)
+_RL_HEAVY: frozenset[str] = frozenset({"create_bracket", "bracket_image", "current_round"})
+
+# Roles allowed to manage event registrations (case-insensitive role name match; keep entries lowercase)
+_MANAGER_ROLE_NAMES: frozenset[str] = frozenset({
+    "iron wolf",
+    "council",
+    "overseer",
+    "prime evils",
+    "the prime evils",
+    "event coordinator",
+})
+
+MANAGE_PERMISSION_MSG = "Missing permission to manage events here."
+REGISTRATION_PERMISSION_MSG = "You don’t have permission to manage registrations here."
+_RL_BLOCKED_MSG = (
+    "Slow down, hero. That command is heavy and can backlog the bot.\n"
+    "Blocked by: **{}**\n"
+    "Try again in a moment."
+)
+
+
+class NotEventManager(app_commands.CheckFailure):
+    """Raised by @_manager_only; message is shown to the user by EventsCog.cog_app_command_error."""
+
+
+def _manager_only(message: str = MANAGE_PERMISSION_MSG):
+    """
+    Permission gate for manager commands, evaluated by discord.py before the command body runs.
+    Not using app_commands.default_permissions: that would hide commands from members who only
+    hold a _MANAGER_ROLE_NAMES role.
+    """
+
+    async def predicate(interaction: discord.Interaction) -> bool:
+        cog = getattr(interaction.command, "binding", None)
+        if isinstance(cog, EventsCog) and await cog._can_manage(interaction):
+            return True
+        raise NotEventManager(message)
 
+    return app_commands.check(predicate)
 
-def _json_obj(v: Any) -> dict:
-    if v is None:
-        return {}
-    if isinstance(v, dict):
-        return v
-    if isinstance(v, str):
-        try:
-            return json.loads(v)
-        except Exception:
-            return {}
-    return {}
+
+# Team draws use their own generator, seeded from the OS (not from process start / command timing)
+_TEAM_RNG = random.Random(int.from_bytes(os.urandom(16), "big"))
+
+# event_team columns _teams_by_seed reads
+_RENDER_TEAM_COLUMNS: tuple[str, ...] = ("event_team_id", "display_name", "seed")
+
+
+def _bytes_file(data: bytes, filename: str) -> discord.File:
+    # BytesIO(bytes) shares the immutable buffer until written to, so this is no copy of the
+    # image; don't wrap it in memoryview/bytearray first, those force BytesIO to copy.
+    return discord.File(BytesIO(data), filename=filename)
 
 
 class EventsCog(commands.Cog):
@@ -59,22 +127,11 @@ class EventsCog(commands.Cog):
     # If True: managers bypass rate limits
     RL_MANAGERS_BYPASS: bool = True
 
-    # Which commands are considered "heavy"
-    RL_HEAVY_COMMANDS: set[str] = {
-        "create_bracket",
-        "bracket_image",
-        "current_round",
-    }
-
-    # Roles allowed to manage event registrations (case-insensitive role name match)
-    MANAGER_ROLE_NAMES = {
-        "iron wolf",
-        "council",
-        "overseer",
-        "prime evils",
-        "the prime evils",
-        "event coordinator",
-    }
+    # Max PIL renders running in worker threads at once (each holds a full canvas in memory)
+    RENDER_CONCURRENCY: int = 4
+
+    # Auto-updated bracket images: reports landing within this window share one re-render
+    IMAGE_REFRESH_DEBOUNCE_SECONDS: float = 0.5
 
     def __init__(
         self,
@@ -88,6 +145,7 @@ class EventsCog(commands.Cog):
         bracket_view: BracketView,
         leaderboard_view: LeaderboardView,
         bracket_diagram: BracketDiagramRenderer,
+        settings_cache: TTLCache,
     ) -> None:
         self.bot = bot
         self.identity_repo = identity_repo
@@ -99,14 +157,47 @@ class EventsCog(commands.Cog):
         self.leaderboard_view = leaderboard_view
         self.bracket_diagram = bracket_diagram
 
-        # rate-limit state (in-memory)
-        self._rl_user_last: dict[tuple[int, str], float] = {}
-        self._rl_channel_last: dict[tuple[int, str], float] = {}
-        self._rl_event_last: dict[tuple[int, int, str], float] = {}
+        # guild_channel_id -> announce settings (shared with AdminCog, which invalidates on change)
+        self.settings_cache = settings_cache
+
+        # discord_user_id -> (nickname, username, account_id); skips the upsert for repeat callers.
+        # TTL re-syncs the platform_account row (username/bot flag) at most every 5 minutes per user.
+        self._acct_cache: TTLCache[int, tuple[str, str, int]] = TTLCache(maxsize=10_000, ttl=300.0)
+
+        # event_id -> {(bracket, round_no, match_no): match ref}; matches are only ever added
+        # (advance creates new ones), so a miss refreshes and create_bracket invalidates
+        self._match_cache: TTLCache[int, dict[tuple[str, int, int], dict[str, Any]]] = TTLCache(maxsize=64)
+
+        # ("event" | "teams" | "matches", event_id) -> rows for the render/image paths; a few seconds of
+        # reuse across back-to-back commands, concurrent misses share one query. Cog write paths call
+        # _invalidate_event_reads; services read the repo directly, so their advance logic never sees it.
+        # Cached rows are shared: treat them as read-only.
+        self._event_reads: AsyncTTLCache[tuple[str, int], Any] = AsyncTTLCache(maxsize=256, ttl=3.0)
+
+        self._render_sema = asyncio.Semaphore(self.RENDER_CONCURRENCY)
+
+        # event_id -> debounced image refresh task; event ids whose state changed mid-refresh
+        self._image_refresh: dict[int, asyncio.Task[None]] = {}
+        self._image_refresh_again: set[int] = set()
+
+        # help files: filename -> resolved path, filename -> (mtime, (text, attachment bytes or None))
+        self._help_path_cache: dict[str, Path] = {}
+        self._help_cache: dict[str, tuple[float, tuple[str, Optional[bytes]]]] = {}
+
+        # rate-limit state (in-memory, no DB): key -> monotonic time the cooldown ends.
+        # Bounded LRU; entries outlive the longest cooldown by at most the TTL, then expire.
+        rl_window = max(self.RL_USER_SECONDS_HEAVY, self.RL_CHANNEL_SECONDS_HEAVY, self.RL_EVENT_SECONDS_HEAVY)
+        # keys: ("u", user_id, cmd) | ("c", channel_id, cmd) | ("e", event_id, channel_id, cmd)
+        self._rl_until: TTLCache[tuple, float] = TTLCache(maxsize=8192, ttl=rl_window)
 
     # -----------------------------
     # Helpers
     # -----------------------------
+    async def _run_render(self, fn: Callable[..., bytes], /, *args: Any, **kwargs: Any) -> bytes:
+        # PIL work is CPU-bound: worker thread keeps the event loop free, semaphore caps memory
+        async with self._render_sema:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
     async def _spin_visual(
         self,
         *,
@@ -126,73 +217,136 @@ class EventsCog(commands.Cog):
             wait=True,
         )
 
-        cursor = random.randint(0, max(0, len(names) - 1))
+        # Decide every frame up front (own list per frame), then render one frame ahead
+        # so PIL work for frame i+1 overlaps the Discord edit of frame i.
+        # A frame identical to the one before it (common with 2-3 names) would be a no-op edit; drop it.
+        plan: list[tuple[list[str], int, str]] = []
+        entries = list(names)
+        for _ in range(frames):
+            random.shuffle(entries)
+            cursor = random.randint(0, max(0, len(entries) - 1))
+            if plan and plan[-1][1] == cursor and plan[-1][0] == entries:
+                continue
+            plan.append((list(entries), cursor, "Spinning…"))
+        last_entries, last_cursor = (plan[-1][0], plan[-1][1]) if plan else (entries, 0)
+        plan.append((last_entries, last_cursor, "LOCKED"))
+        spin_frames = len(plan) - 1
+
+        def _render(i: int) -> "asyncio.Task[bytes]":
+            frame_entries, frame_cursor, phase = plan[i]
+            return asyncio.create_task(
+                self._run_render(
+                    renderer.render_frame,
+                    title=title,
+                    entries=frame_entries,
+                    cursor=frame_cursor,
+                    phase=phase,
+                )
+            )
 
-        for i in range(frames):
-            random.shuffle(names)
-            cursor = random.randint(0, max(0, len(names) - 1))
+        pending = _render(0)
+        try:
+            for i in range(spin_frames):
+                png = await pending
+                pending = _render(i + 1)
 
-            png = renderer.render_frame(
-                title=title,
-                entries=names,
-                cursor=cursor,
-                phase="Spinning…",
-            )
+                await msg.edit(attachments=[_bytes_file(png, "spin.png")])
 
-            file = discord.File(BytesIO(png), filename="spin.png")
-            await msg.edit(attachments=[file])
+                await asyncio.sleep(delay)
 
-            await asyncio.sleep(delay)
+            # Final lock frame
+            png = await pending
+            await msg.edit(content="🔥 **Teams Locked**", attachments=[_bytes_file(png, "spin_final.png")])
+        except asyncio.CancelledError:
+            # caller gave up (e.g. randomize_teams' writes failed): don't leave a half-spun message
+            pending.cancel()
+            try:
+                await msg.delete()
+            except Exception:
+                pass
+            raise
+        except BaseException:
+            pending.cancel()
+            raise
 
-        # Final lock frame
-        png = renderer.render_frame(
-            title=title,
-            entries=names,
-            cursor=cursor,
-            phase="LOCKED",
-        )
-        file = discord.File(BytesIO(png), filename="spin_final.png")
-        await msg.edit(content="🔥 **Teams Locked**", attachments=[file])
 
 
+    def _resolve_help_path(self, filename: str) -> Optional[Path]:
+        p = self._help_path_cache.get(filename)
+        if p is not None:
+            return p
 
-    def _load_help_text(self, filename: str, *, fallback: str = "") -> str:
-        """
-        Loads markdown/text from /data/help so you can edit help copy without touching code.
-        """
         candidates = [
             Path("data") / "help" / filename,  # run from repo root
             Path(__file__).resolve().parent.parent / "data" / "help" / filename,  # cogs/ -> project/data/help
             Path(__file__).resolve().parent / "data" / "help" / filename,  # cogs/data/help (alt)
         ]
-        for p in candidates:
+        for c in candidates:
             try:
-                if p.exists() and p.is_file():
-                    return (p.read_text(encoding="utf-8", errors="ignore") or fallback).strip()
+                if c.is_file():
+                    self._help_path_cache[filename] = c
+                    return c
             except Exception:
                 continue
-        return (fallback or "Help file not found.").strip()
+        return None
+
+    HELP_INLINE_CHARS: int = 1900
+
+    def _load_help(self, filename: str, *, fallback: str = "") -> tuple[str, Optional[bytes]]:
+        """
+        Loads markdown/text from /data/help so you can edit help copy without touching code.
+        Returns (text, None) when it fits in one message, else (text, utf-8 bytes) to send as an attachment.
+        Cached per file; re-read only when its mtime changes.
+        """
+        p = self._resolve_help_path(filename)
+        if p is not None:
+            try:
+                mtime = p.stat().st_mtime
+                cached = self._help_cache.get(filename)
+                if cached is not None and cached[0] == mtime:
+                    return cached[1]
+                text = (p.read_text(encoding="utf-8", errors="ignore") or fallback).strip()
+                entry = self._help_entry(text)
+                self._help_cache[filename] = (mtime, entry)
+                return entry
+            except Exception:
+                # file moved/deleted -> resolve again next time
+                self._help_path_cache.pop(filename, None)
+                self._help_cache.pop(filename, None)
+        return self._help_entry((fallback or "Help file not found.").strip())
+
+    def _help_entry(self, text: str) -> tuple[str, Optional[bytes]]:
+        if len(text) <= self.HELP_INLINE_CHARS:
+            return text, None
+        return text, text.encode("utf-8")
+
+    async def _send_help(self, interaction: discord.Interaction, filename: str, *, fallback: str, label: str) -> None:
+        text, data = self._load_help(filename, fallback=fallback)
+        if data is None:
+            await interaction.response.send_message(f"```md\n{text}\n```", ephemeral=True)
+            return
+        # too long for one message: one attachment instead of a followup per 1900 chars
+        await interaction.response.send_message(
+            content=f"{label} (see attached):",
+            file=_bytes_file(data, filename),
+            ephemeral=True,
+        )
 
     def _has_manager_role(self, member: discord.Member) -> bool:
-        want = {n.lower() for n in self.MANAGER_ROLE_NAMES}
-        return any((r.name or "").lower() in want for r in getattr(member, "roles", []))
+        return any(r.name and r.name.lower() in _MANAGER_ROLE_NAMES for r in getattr(member, "roles", ()))
 
     async def _can_manage(self, interaction: discord.Interaction) -> bool:
-        if not interaction.guild:
-            return False
-        if isinstance(interaction.user, discord.Member):
-            perms = interaction.user.guild_permissions
-            if perms.manage_guild or perms.manage_channels:
-                return True
-            return self._has_manager_role(interaction.user)
-        return False
-
-    def _now(self) -> float:
-        return time.monotonic()
+        # memoized per interaction: @_manager_only and the rate-limit bypass both ask
+        cached = interaction.extras.get("_can_manage")
+        if cached is not None:
+            return cached
 
-    def _cooldown_left(self, last_ts: float, cooldown: int) -> int:
-        left = int(round((last_ts + cooldown) - self._now()))
-        return max(0, left)
+        ok = False
+        if interaction.guild and isinstance(interaction.user, discord.Member):
+            perms = interaction.user.guild_permissions
+            ok = bool(perms.manage_guild or perms.manage_channels) or self._has_manager_role(interaction.user)
+        interaction.extras["_can_manage"] = ok
+        return ok
 
     async def _rate_limit_heavy(
         self,
@@ -205,7 +359,7 @@ class EventsCog(commands.Cog):
         Returns True if allowed, False if blocked (and sends a friendly message).
         Applies user+channel+event cooldowns for heavy commands.
         """
-        if command_name not in self.RL_HEAVY_COMMANDS:
+        if command_name not in _RL_HEAVY:
             return True
 
         if self.RL_MANAGERS_BYPASS and await self._can_manage(interaction):
@@ -213,149 +367,252 @@ class EventsCog(commands.Cog):
 
         user_id = int(getattr(interaction.user, "id", 0) or 0)
         channel_id = int(getattr(interaction.channel, "id", 0) or 0)
+        response = interaction.response
 
-        now = self._now()
-        blocks: list[str] = []
+        now = _monotonic()
+        rl_until = self._rl_until
 
-        # Per-user
-        ku = (user_id, command_name)
-        last_u = self._rl_user_last.get(ku)
-        if last_u is not None:
-            left = self._cooldown_left(last_u, self.RL_USER_SECONDS_HEAVY)
-            if left > 0:
-                blocks.append(f"user cooldown: {left}s")
-        # Per-channel
-        kc = (channel_id, command_name)
-        last_c = self._rl_channel_last.get(kc)
-        if last_c is not None:
-            left = self._cooldown_left(last_c, self.RL_CHANNEL_SECONDS_HEAVY)
-            if left > 0:
-                blocks.append(f"channel cooldown: {left}s")
-
-        # Per-event
+        probes: list[tuple[tuple, int, str]] = [
+            (("u", user_id, command_name), self.RL_USER_SECONDS_HEAVY, "user"),
+            (("c", channel_id, command_name), self.RL_CHANNEL_SECONDS_HEAVY, "channel"),
+        ]
         if event_id is not None:
-            ke = (int(event_id), channel_id, command_name)
-            last_e = self._rl_event_last.get(ke)
-            if last_e is not None:
-                left = self._cooldown_left(last_e, self.RL_EVENT_SECONDS_HEAVY)
-                if left > 0:
-                    blocks.append(f"event cooldown: {left}s")
+            probes.append((("e", int(event_id), channel_id, command_name), self.RL_EVENT_SECONDS_HEAVY, "event"))
+
+        blocks: list[str] = []
+        for key, _cooldown, label in probes:
+            left = rl_until.get(key, 0.0) - now
+            if left > 0.5:  # reported rounded; under half a second counts as expired
+                blocks.append(f"{label} cooldown: {int(round(left))}s")
 
         if blocks:
-            msg = (
-                "Slow down, hero. That command is heavy and can backlog the bot.\n"
-                f"Blocked by: **{', '.join(blocks)}**\n"
-                "Try again in a moment."
-            )
+            msg = _RL_BLOCKED_MSG.format(", ".join(blocks))
 
             # If already deferred, use followup. Otherwise respond.
             try:
-                if interaction.response.is_done():
+                if response.is_done():
                     await interaction.followup.send(msg, ephemeral=True)
                 else:
-                    await interaction.response.send_message(msg, ephemeral=True)
+                    await response.send_message(msg, ephemeral=True)
             except Exception:
                 pass
             return False
 
-        # Record stamps (only when allowed)
-        self._rl_user_last[ku] = now
-        self._rl_channel_last[kc] = now
-        if event_id is not None:
-            self._rl_event_last[(int(event_id), channel_id, command_name)] = now
+        # Record deadlines (only when allowed)
+        for key, cooldown, _label in probes:
+            rl_until.set(key, now + cooldown)
 
         return True
 
-    async def _build_teams_by_seed(self, event_id: int) -> dict[int, dict[str, Any]]:
-        teams = await self.event_repo.list_event_teams(event_id=event_id)
-        teams_by_seed: dict[int, dict[str, Any]] = {}
-        for t in teams or []:
-            seed = t.get("seed")
-            if seed is None:
-                continue
-            teams_by_seed[int(seed)] = {
+    @staticmethod
+    def _teams_by_seed(teams: Optional[list[Mapping[str, Any]]]) -> dict[int, dict[str, Any]]:
+        return {
+            int(t["seed"]): {
                 "event_team_id": int(t["event_team_id"]),
-                "display_name": t.get("display_name") or f"Team {seed}",
+                "display_name": t["display_name"] or f"Team {t['seed']}",
             }
-        return teams_by_seed
+            for t in teams or []
+            if t["seed"] is not None
+        }
 
-    async def _render_bracket_png_bytes(self, event_id: int) -> Optional[bytes]:
-        ev = await self.event_repo.get_event(event_id=event_id)
-        if not ev:
-            return None
+    async def _get_event(self, event_id: int) -> Optional[EventMeta]:
+        return await self._event_reads.get_or_load(
+            ("event", event_id), lambda: self.event_repo.get_event_meta(event_id=event_id)
+        )
 
-        teams_by_seed = await self._build_teams_by_seed(event_id)
-        matches = await self.event_repo.list_matches(event_id=event_id)
+    async def _list_render_teams(self, event_id: int) -> list[Mapping[str, Any]]:
+        return await self._event_reads.get_or_load(
+            ("teams", event_id),
+            lambda: self.event_repo.list_event_teams(event_id=event_id, columns=_RENDER_TEAM_COLUMNS),
+        )
 
-        if not teams_by_seed:
-            return None
+    async def _list_render_matches(self, event_id: int) -> list[Mapping[str, Any]]:
+        return await self._event_reads.get_or_load(
+            ("matches", event_id),
+            lambda: self.event_repo.list_matches(event_id=event_id, columns=MATCH_COLUMNS),
+        )
+
+    def _invalidate_event_reads(self, event_id: int) -> None:
+        for kind in ("event", "teams", "matches"):
+            self._event_reads.invalidate((kind, event_id))
+
+    async def _load_render_inputs(
+        self, event_id: int, *, ev: Optional[EventMeta] = None
+    ) -> tuple[Optional[EventMeta], dict[int, dict[str, Any]], list[Mapping[str, Any]]]:
+        """
+        (event, teams_by_seed, matches) for the diagram renderers; the reads are independent,
+        so they run concurrently on the pool. Pass ev when the caller already loaded the event.
+        """
+        if ev is None:
+            ev, teams, matches = await asyncio.gather(
+                self._get_event(event_id),
+                self._list_render_teams(event_id),
+                self._list_render_matches(event_id),
+            )
+        else:
+            teams, matches = await asyncio.gather(
+                self._list_render_teams(event_id),
+                self._list_render_matches(event_id),
+            )
+        return ev, self._teams_by_seed(teams), list(matches or [])
+
+    async def _get_match_ref(self, event_id: int, key: tuple[str, int, int]) -> Optional[dict[str, Any]]:
+        refs = self._match_cache.get(event_id)
+        if refs is None or key not in refs:
+            rows = await self.event_repo.list_match_refs(event_id=event_id)
+            refs = {(str(r["bracket"]).upper(), int(r["round_no"]), int(r["match_no"])): dict(r) for r in rows}
+            self._match_cache.set(event_id, refs)
+        return refs.get(key)
 
-        png = self.bracket_diagram.render_png(
+    async def _bracket_png(
+        self,
+        event_id: int,
+        ev: EventMeta,
+        teams_by_seed: dict[int, dict[str, Any]],
+        matches: list[Mapping[str, Any]],
+    ) -> bytes:
+        render_args: dict[str, Any] = dict(
             event_id=event_id,
-            event_format=str(ev.get("format") or "double_elim"),
+            event_format=ev.format,
             teams_by_seed=teams_by_seed,
-            matches=list(matches or []),
+            matches=matches,
             title=f"Event {event_id} Bracket",
         )
-        return png
-
-    async def _render_current_round_png_bytes(self, event_id: int) -> Optional[bytes]:
-        ev = await self.event_repo.get_event(event_id=event_id)
-        if not ev:
-            return None
-
-        teams_by_seed = await self._build_teams_by_seed(event_id)
-        matches = await self.event_repo.list_matches(event_id=event_id)
-
-        if not teams_by_seed:
-            return None
+        # a cache hit is answered here, without waiting for a render slot or a worker thread
+        png = self.bracket_diagram.cached_png(self.bracket_diagram.bracket_png_key(**render_args))
+        if png is not None:
+            return png
+        return await self._run_render(self.bracket_diagram.render_png, **render_args)
 
-        png = self.bracket_diagram.render_current_round_png(
+    async def _current_round_png(
+        self,
+        event_id: int,
+        ev: EventMeta,
+        teams_by_seed: dict[int, dict[str, Any]],
+        matches: list[Mapping[str, Any]],
+    ) -> bytes:
+        render_args: dict[str, Any] = dict(
             event_id=event_id,
-            event_format=str(ev.get("format") or "double_elim"),
+            event_format=ev.format,
             teams_by_seed=teams_by_seed,
-            matches=list(matches or []),
+            matches=matches,
             title=f"Event {event_id} Current Matches",
             statuses=("open", "pending"),
             max_cards=24,
             cards_per_row=None,
         )
-        return png
-
-    async def _save_bracket_image_message_ref(self, event_id: int, channel_id: int, message_id: int) -> None:
-        sql = """
-        UPDATE event
-        SET metadata = JSON_SET(
-            COALESCE(metadata, JSON_OBJECT()),
-            '$.bracket_image_channel_id', CAST(%s AS JSON),
-            '$.bracket_image_message_id', CAST(%s AS JSON)
-        )
-        WHERE event_id = %s;
+        # a cache hit is answered here, without waiting for a render slot or a worker thread
+        png = self.bracket_diagram.cached_png(self.bracket_diagram.current_round_png_key(**render_args))
+        if png is not None:
+            return png
+        return await self._run_render(self.bracket_diagram.render_current_round_png, **render_args)
+
+    async def _render_bracket_png_bytes(self, event_id: int, *, ev: Optional[EventMeta] = None) -> Optional[bytes]:
+        ev, teams_by_seed, matches = await self._load_render_inputs(event_id, ev=ev)
+        if not ev or not teams_by_seed:
+            return None
+        return await self._bracket_png(event_id, ev, teams_by_seed, matches)
+
+    async def _render_current_round_png_bytes(self, event_id: int, *, ev: Optional[EventMeta] = None) -> Optional[bytes]:
+        ev, teams_by_seed, matches = await self._load_render_inputs(event_id, ev=ev)
+        if not ev or not teams_by_seed:
+            return None
+        return await self._current_round_png(event_id, ev, teams_by_seed, matches)
+
+    async def _render_both_pngs(
+        self, event_id: int, *, ev: Optional[EventMeta] = None
+    ) -> tuple[Optional[bytes], Optional[bytes]]:
+        """
+        (bracket, current_round) PNGs from one set of reads; the two renders run in parallel threads.
         """
-        await self.event_repo.execute(sql, (int(channel_id), int(message_id), int(event_id)))
-
-    async def _save_current_round_image_message_ref(self, event_id: int, channel_id: int, message_id: int) -> None:
-        sql = """
-        UPDATE event
-        SET metadata = JSON_SET(
-            COALESCE(metadata, JSON_OBJECT()),
-            '$.current_round_image_channel_id', CAST(%s AS JSON),
-            '$.current_round_image_message_id', CAST(%s AS JSON)
+        ev, teams_by_seed, matches = await self._load_render_inputs(event_id, ev=ev)
+        if not ev or not teams_by_seed:
+            return None, None
+        bracket_png, current_png = await asyncio.gather(
+            self._bracket_png(event_id, ev, teams_by_seed, matches),
+            self._current_round_png(event_id, ev, teams_by_seed, matches),
         )
-        WHERE event_id = %s;
+        return bracket_png, current_png
+
+    async def _save_image_refs(self, event_id: int, refs: Mapping[str, tuple[int, int]]) -> None:
+        """
+        refs: kind ('bracket' | 'current_round') -> (channel_id, message_id); one UPDATE for all kinds.
         """
-        await self.event_repo.execute(sql, (int(channel_id), int(message_id), int(event_id)))
+        if refs:
+            await self.event_repo.set_image_message_refs(event_id=event_id, refs=refs)
+            self._event_reads.invalidate(("event", event_id))
 
-    async def _upsert_bracket_image_post(self, event_id: int, channel: discord.TextChannel) -> Optional[discord.Message]:
-        ev = await self.event_repo.get_event(event_id=event_id)
+    async def _refresh_image_posts(self, event_id: int, channel: discord.TextChannel) -> None:
+        """
+        Upsert both auto-updated images off one event read; new message refs are written together.
+        """
+        ev = await self._get_event(event_id)
+        if not ev:
+            return
+        bracket_png, current_png = await self._render_both_pngs(event_id, ev=ev)
+        if not bracket_png:
+            return
+
+        refs: dict[str, tuple[int, int]] = {}
+        await self._upsert_bracket_image_post(event_id, channel, ev=ev, png=bracket_png, refs=refs)
+        await self._upsert_current_round_image_post(event_id, channel, ev=ev, png=current_png, refs=refs)
+        await self._save_image_refs(event_id, refs)
+
+    def _schedule_image_refresh(self, event_id: int, channel: discord.TextChannel) -> None:
+        """
+        Debounced, single-flight _refresh_image_posts per event. A call while one is pending is
+        folded into it; a call while it is already rendering queues exactly one more pass.
+        """
+        task = self._image_refresh.get(event_id)
+        if task is not None and not task.done():
+            self._image_refresh_again.add(event_id)
+            return
+        self._image_refresh[event_id] = asyncio.create_task(self._debounced_image_refresh(event_id, channel))
+
+    async def _debounced_image_refresh(self, event_id: int, channel: discord.TextChannel) -> None:
+        try:
+            while True:
+                await asyncio.sleep(self.IMAGE_REFRESH_DEBOUNCE_SECONDS)
+                # anything scheduled before this point is covered by the reads below
+                self._image_refresh_again.discard(event_id)
+                try:
+                    await self._refresh_image_posts(event_id, channel)
+                except Exception:
+                    log.exception("Image refresh failed for event %s", event_id)
+                if event_id not in self._image_refresh_again:
+                    return
+        finally:
+            if self._image_refresh.get(event_id) is asyncio.current_task():
+                del self._image_refresh[event_id]
+
+    async def cog_unload(self) -> None:
+        for task in self._image_refresh.values():
+            task.cancel()
+
+    async def _upsert_bracket_image_post(
+        self,
+        event_id: int,
+        channel: discord.TextChannel,
+        *,
+        ev: Optional[EventMeta] = None,
+        png: Optional[bytes] = None,
+        refs: Optional[dict[str, tuple[int, int]]] = None,
+    ) -> Optional[discord.Message]:
+        """
+        Pass png to post already-rendered bytes, and refs to collect a new message ref for the
+        caller to save (both used by _refresh_image_posts).
+        """
+        if ev is None:
+            ev = await self._get_event(event_id)
         if not ev:
             return None
 
-        png = await self._render_bracket_png_bytes(event_id)
+        if png is None:
+            png = await self._render_bracket_png_bytes(event_id, ev=ev)
         if not png:
             return None
 
-        md = _json_obj(ev.get("metadata"))
+        md = ev.metadata
         prior_channel_id = md.get("bracket_image_channel_id")
         prior_message_id = md.get("bracket_image_message_id")
 
@@ -365,7 +622,7 @@ class EventsCog(commands.Cog):
             if isinstance(ch, discord.TextChannel):
                 target_channel = ch
 
-        file_obj = discord.File(BytesIO(png), filename=f"event_{event_id}_bracket.png")
+        file_obj = _bytes_file(png, f"event_{event_id}_bracket.png")
         content = f"**Event {event_id} Bracket** (auto-updated)"
 
         if prior_channel_id and prior_message_id and isinstance(target_channel, discord.TextChannel):
@@ -378,21 +635,34 @@ class EventsCog(commands.Cog):
 
         if isinstance(target_channel, discord.TextChannel):
             msg = await target_channel.send(content=content, file=file_obj)
-            await self._save_bracket_image_message_ref(event_id, target_channel.id, msg.id)
+            if refs is not None:
+                refs["bracket"] = (target_channel.id, msg.id)
+            else:
+                await self._save_image_refs(event_id, {"bracket": (target_channel.id, msg.id)})
             return msg
 
         return None
 
-    async def _upsert_current_round_image_post(self, event_id: int, channel: discord.TextChannel) -> Optional[discord.Message]:
-        ev = await self.event_repo.get_event(event_id=event_id)
+    async def _upsert_current_round_image_post(
+        self,
+        event_id: int,
+        channel: discord.TextChannel,
+        *,
+        ev: Optional[EventMeta] = None,
+        png: Optional[bytes] = None,
+        refs: Optional[dict[str, tuple[int, int]]] = None,
+    ) -> Optional[discord.Message]:
+        if ev is None:
+            ev = await self._get_event(event_id)
         if not ev:
             return None
 
-        png = await self._render_current_round_png_bytes(event_id)
+        if png is None:
+            png = await self._render_current_round_png_bytes(event_id, ev=ev)
         if not png:
             return None
 
-        md = _json_obj(ev.get("metadata"))
+        md = ev.metadata
         prior_channel_id = md.get("current_round_image_channel_id")
         prior_message_id = md.get("current_round_image_message_id")
 
@@ -402,7 +672,7 @@ class EventsCog(commands.Cog):
             if isinstance(ch, discord.TextChannel):
                 target_channel = ch
 
-        file_obj = discord.File(BytesIO(png), filename=f"event_{event_id}_current.png")
+        file_obj = _bytes_file(png, f"event_{event_id}_current.png")
         content = f"**Event {event_id} Current Matches** (auto-updated)"
 
         if prior_channel_id and prior_message_id and isinstance(target_channel, discord.TextChannel):
@@ -415,7 +685,10 @@ class EventsCog(commands.Cog):
 
         if isinstance(target_channel, discord.TextChannel):
             msg = await target_channel.send(content=content, file=file_obj)
-            await self._save_current_round_image_message_ref(event_id, target_channel.id, msg.id)
+            if refs is not None:
+                refs["current_round"] = (target_channel.id, msg.id)
+            else:
+                await self._save_image_refs(event_id, {"current_round": (target_channel.id, msg.id)})
             return msg
 
         return None
@@ -434,14 +707,19 @@ class EventsCog(commands.Cog):
         username = getattr(member, "name", None) or "unknown"
         nickname = getattr(member, "display_name", None) or username
 
-        if nickname and username and nickname != username:
+        # repeat caller with unchanged names: no formatting, no DB
+        cached = self._acct_cache.get(member.id)
+        if cached is not None and cached[0] == nickname and cached[1] == username:
+            return cached[2]
+
+        if nickname != username:
             combined = f"{nickname} (@{username})"
         else:
-            combined = nickname or username
+            combined = nickname
 
         combined = str(combined)[:128]
 
-        return await self.identity_repo.upsert_discord_account(
+        account_id = await self.identity_repo.upsert_discord_account(
             discord_user_id=member.id,
             display_name=combined,
             is_bot=getattr(member, "bot", None),
@@ -451,41 +729,50 @@ class EventsCog(commands.Cog):
                 "discord_nickname": str(nickname),
             },
         )
+        self._acct_cache.set(member.id, (nickname, username, account_id))
+        return account_id
 
     async def _get_guild_announce_channel_internal_id(self, guild_channel_id: int) -> Optional[int]:
-        row = await self.identity_repo.fetch_one("SELECT metadata FROM channel WHERE channel_id=%s;", (guild_channel_id,))
-        if not row:
-            return None
-        md = _json_obj(row.get("metadata"))
-        v = md.get("announce_channel_id")
+        settings = self.settings_cache.get(guild_channel_id)
+        if settings is None:
+            row = await self.identity_repo.get_guild_announce_settings(guild_channel_id=guild_channel_id)
+            settings = dict(row) if row else {}
+            self.settings_cache.set(guild_channel_id, settings)
+
+        v = settings.get("announce_channel_id")
         try:
             return int(v) if v is not None else None
         except Exception:
             return None
 
+    async def cog_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError) -> None:
+        if isinstance(error, NotEventManager):
+            if interaction.response.is_done():
+                await interaction.followup.send(str(error), ephemeral=True)
+            else:
+                await interaction.response.send_message(str(error), ephemeral=True)
+
     # -----------------------------
     # Commands
     # -----------------------------
 
     @app_commands.command(name="help", description="Show bot help.")
     async def help(self, interaction: discord.Interaction) -> None:
-        text = self._load_help_text("help.md", fallback="Help is not configured yet. Add `data/help/help.md`.")
-        if len(text) <= 1900:
-            await interaction.response.send_message(f"```md\n{text}\n```", ephemeral=True)
-            return
-        await interaction.response.send_message("```md\nHelp is long — sending in parts.\n```", ephemeral=True)
-        for chunk in [text[i : i + 1900] for i in range(0, len(text), 1900)]:
-            await interaction.followup.send(f"```md\n{chunk}\n```", ephemeral=True)
+        await self._send_help(
+            interaction,
+            "help.md",
+            fallback="Help is not configured yet. Add `data/help/help.md`.",
+            label="Help",
+        )
 
     @app_commands.command(name="commands", description="Show bot commands.")
     async def commands(self, interaction: discord.Interaction) -> None:
-        text = self._load_help_text("commands.md", fallback="Commands list is not configured yet. Add `data/help/commands.md`.")
-        if len(text) <= 1900:
-            await interaction.response.send_message(f"```md\n{text}\n```", ephemeral=True)
-            return
-        await interaction.response.send_message("```md\nCommands list is long — sending in parts.\n```", ephemeral=True)
-        for chunk in [text[i : i + 1900] for i in range(0, len(text), 1900)]:
-            await interaction.followup.send(f"```md\n{chunk}\n```", ephemeral=True)
+        await self._send_help(
+            interaction,
+            "commands.md",
+            fallback="Commands list is not configured yet. Add `data/help/commands.md`.",
+            label="Commands",
+        )
 
     @event.command(name="create", description="Create a new event (tournament).")
     @app_commands.describe(
@@ -551,31 +838,29 @@ class EventsCog(commands.Cog):
         await interaction.followup.send(embed=e)
 
     @event.command(name="open", description="Open registrations for an event.")
+    @_manager_only()
     async def open(self, interaction: discord.Interaction, event_id: int) -> None:
-        if not await self._can_manage(interaction):
-            await interaction.response.send_message("Missing permission to manage events here.", ephemeral=True)
-            return
         await interaction.response.defer(ephemeral=True)
 
         await self.event_repo.set_event_status(event_id=event_id, status="open")
+        self._invalidate_event_reads(event_id)
         e = self.embeds.success(title="Event opened", description=f"Registrations are now open for event `{event_id}`.")
         await interaction.followup.send(embed=e, ephemeral=True)
 
     @event.command(name="lock", description="Lock registrations for an event.")
+    @_manager_only()
     async def lock(self, interaction: discord.Interaction, event_id: int) -> None:
-        if not await self._can_manage(interaction):
-            await interaction.response.send_message("Missing permission to manage events here.", ephemeral=True)
-            return
         await interaction.response.defer(ephemeral=True)
 
         await self.event_repo.set_event_status(event_id=event_id, status="locked")
+        self._invalidate_event_reads(event_id)
         e = self.embeds.success(title="Event locked", description=f"Registrations locked for event `{event_id}`.")
         await interaction.followup.send(embed=e, ephemeral=True)
 
     @event.command(name="info", description="Show event details.")
     async def info(self, interaction: discord.Interaction, event_id: int) -> None:
         await interaction.response.defer(ephemeral=True)
-        ev = await self.event_repo.get_event(event_id=event_id)
+        ev = await self.event_repo.get_event_summary(event_id=event_id)
         if not ev:
             await interaction.followup.send(
                 embed=self.embeds.error(title="Not found", description="Event not found."),
@@ -583,11 +868,14 @@ class EventsCog(commands.Cog):
             )
             return
 
-        e = self.embeds.info(title=f"Event {event_id}: {ev.get('name')}")
-        e.add_field(name="Status", value=str(ev.get("status")), inline=True)
-        e.add_field(name="Format", value=str(ev.get("format")), inline=True)
-        e.add_field(name="Team Size", value=f"{int(ev.get('team_size'))}v{int(ev.get('team_size'))}", inline=True)
-        e.add_field(name="Max Players", value=str(ev.get("max_players")), inline=True)
+        e = self.embeds.event_info(
+            event_id=event_id,
+            name=ev["name"],
+            status=ev["status"],
+            format=ev["format"],
+            team_size=int(ev["team_size"]),
+            max_players=int(ev["max_players"]),
+        )
         await interaction.followup.send(embed=e, ephemeral=True)
 
     @event.command(name="join", description="Join an event (register).")
@@ -597,12 +885,12 @@ class EventsCog(commands.Cog):
             return
         await interaction.response.defer(ephemeral=True)
 
-        ev = await self.event_repo.get_event(event_id=event_id)
+        ev = await self.event_repo.get_event_meta(event_id=event_id)
         if not ev:
             await interaction.followup.send(embed=self.embeds.error(title="Not found", description="Event not found."), ephemeral=True)
             return
 
-        status = str(ev.get("status") or "").lower()
+        status = ev.status
         if status not in ("open", "draft"):
             await interaction.followup.send(embed=self.embeds.warning(title="Closed", description=f"Event is `{status}`."), ephemeral=True)
             return
@@ -631,18 +919,16 @@ class EventsCog(commands.Cog):
 
     @event.command(name="add_player", description="Manager: add a member to an event registration.")
     @app_commands.describe(event_id="Event ID", member="Member to register")
+    @_manager_only(REGISTRATION_PERMISSION_MSG)
     async def add_player(self, interaction: discord.Interaction, event_id: int, member: discord.Member) -> None:
-        if not await self._can_manage(interaction):
-            await interaction.response.send_message("You don’t have permission to manage registrations here.", ephemeral=True)
-            return
         await interaction.response.defer(ephemeral=True)
 
-        ev = await self.event_repo.get_event(event_id=event_id)
+        ev = await self.event_repo.get_event_meta(event_id=event_id)
         if not ev:
             await interaction.followup.send(embed=self.embeds.error(title="Not found", description="Event not found."), ephemeral=True)
             return
 
-        status = str(ev.get("status") or "").lower()
+        status = ev.status
         if status not in ("draft", "open", "locked"):
             await interaction.followup.send(
                 embed=self.embeds.warning(
@@ -667,18 +953,16 @@ class EventsCog(commands.Cog):
 
     @event.command(name="remove_player", description="Manager: remove a member from an event registration.")
     @app_commands.describe(event_id="Event ID", member="Member to drop")
+    @_manager_only(REGISTRATION_PERMISSION_MSG)
     async def remove_player(self, interaction: discord.Interaction, event_id: int, member: discord.Member) -> None:
-        if not await self._can_manage(interaction):
-            await interaction.response.send_message("You don’t have permission to manage registrations here.", ephemeral=True)
-            return
         await interaction.response.defer(ephemeral=True)
 
-        ev = await self.event_repo.get_event(event_id=event_id)
+        ev = await self.event_repo.get_event_meta(event_id=event_id)
         if not ev:
             await interaction.followup.send(embed=self.embeds.error(title="Not found", description="Event not found."), ephemeral=True)
             return
 
-        status = str(ev.get("status") or "").lower()
+        status = ev.status
         if status not in ("draft", "open", "locked"):
             await interaction.followup.send(
                 embed=self.embeds.warning(
@@ -711,7 +995,7 @@ class EventsCog(commands.Cog):
     async def registrations(self, interaction: discord.Interaction, event_id: int) -> None:
         await interaction.response.defer(ephemeral=False)
 
-        ev = await self.event_repo.get_event(event_id=event_id)
+        ev = await self.event_repo.get_event_meta(event_id=event_id)
         if not ev:
             await interaction.followup.send(embed=self.embeds.error(title="Not found", description="Event not found."))
             return
@@ -721,16 +1005,14 @@ class EventsCog(commands.Cog):
             await interaction.followup.send(embed=self.embeds.warning(title="No registrations", description="Nobody has registered yet."))
             return
 
-        lines: list[str] = []
-        lines.append(f"=== Event {event_id} Registrations ===")
-        lines.append(f"Status: {str(ev.get('status') or '').lower()}")
-        lines.append("")
-        for i, r in enumerate(regs, start=1):
-            name = str(r.get("display_name") or f"acct:{r.get('account_id')}")
-            status = str(r.get("status") or "")
-            lines.append(f"{i:02d}. {name}  [{status}]")
+        header = f"=== Event {event_id} Registrations ===\nStatus: {ev.status}\n\n"
+        # list_registrations always returns these keys; display_name can be NULL
+        body = "\n".join(
+            f"{i:02d}. {r['display_name'] or 'acct:' + str(r['account_id'])}  [{r['status'] or ''}]"
+            for i, r in enumerate(regs, start=1)
+        )
 
-        await interaction.followup.send("```text\n" + "\n".join(lines).rstrip() + "\n```")
+        await interaction.followup.send("```text\n" + header + body.rstrip() + "\n```")
 
     @event.command(name="add_fake_registrations", description="Manager: add fake registrations to test scale.")
     @app_commands.describe(
@@ -738,6 +1020,7 @@ class EventsCog(commands.Cog):
         count="How many fake players to add",
         name_prefix="Prefix for fake names",
     )
+    @_manager_only(REGISTRATION_PERMISSION_MSG)
     async def add_fake_registrations(
         self,
         interaction: discord.Interaction,
@@ -745,17 +1028,14 @@ class EventsCog(commands.Cog):
         count: app_commands.Range[int, 1, 200],
         name_prefix: str = "FAKE",
     ) -> None:
-        if not await self._can_manage(interaction):
-            await interaction.response.send_message("You don’t have permission to manage registrations here.", ephemeral=True)
-            return
         await interaction.response.defer(ephemeral=True)
 
-        ev = await self.event_repo.get_event(event_id=event_id)
+        ev = await self.event_repo.get_event_meta(event_id=event_id)
         if not ev:
             await interaction.followup.send(embed=self.embeds.error(title="Not found", description="Event not found."), ephemeral=True)
             return
 
-        status = str(ev.get("status") or "").lower()
+        status = ev.status
         if status not in ("draft", "open", "locked"):
             await interaction.followup.send(
                 embed=self.embeds.warning(
@@ -766,25 +1046,22 @@ class EventsCog(commands.Cog):
             )
             return
 
-        added = 0
         base_fake_id = 99_000_000_000_000_000
+        generated_by = str(interaction.user.id)
 
-        for _ in range(int(count)):
-            fake_discord_id = base_fake_id + random.randint(1, 9_999_999_999)
-            fake_name = f"{name_prefix}_{fake_discord_id % 100000:05d}"
-            acct_id = await self.identity_repo.upsert_discord_account(
-                discord_user_id=int(fake_discord_id),
-                display_name=str(fake_name)[:128],
-                is_bot=True,
-                metadata={"source": "fake", "generated_by": str(interaction.user.id)},
-            )
-
-            await self.event_repo.register_player(
-                event_id=event_id,
-                account_id=int(acct_id),
-                metadata={"fake": True, "generated_by_discord_user_id": str(interaction.user.id)},
-            )
-            added += 1
+        # distinct offsets -> no two fake players collapse into one account
+        fake_ids = [base_fake_id + i for i in random.sample(range(1, 10_000_000_000), int(count))]
+        acct_md = {"source": "fake", "generated_by": generated_by}  # shared: serialized once per batch
+        acct_by_discord_id = await self.identity_repo.bulk_upsert_discord_accounts(
+            [(fake_id, f"{name_prefix}_{fake_id % 100000:05d}"[:128], True, acct_md) for fake_id in fake_ids]
+        )
+        reg_md = {"fake": True, "generated_by_discord_user_id": generated_by}
+        await self.event_repo.bulk_register_players(
+            event_id=event_id,
+            rows=[(acct_by_discord_id[fake_id], reg_md) for fake_id in fake_ids],
+            trusted_ids=True,  # event fetched above; account ids just returned by the upsert
+        )
+        added = len(fake_ids)
 
         await interaction.followup.send(
             embed=self.embeds.success(
@@ -795,32 +1072,27 @@ class EventsCog(commands.Cog):
         )
 
     @event.command(name="randomize_teams", description="Randomize teams from registrations and create event_team records.")
+    @_manager_only()
     async def randomize_teams(self, interaction: discord.Interaction, event_id: int) -> None:
-        if not await self._can_manage(interaction):
-            await interaction.response.send_message("Missing permission to manage events here.", ephemeral=True)
-            return
         await interaction.response.defer(ephemeral=False)
 
-        ev = await self.event_repo.get_event(event_id=event_id)
+        # independent reads -> overlap them on the pool
+        ev, active = await asyncio.gather(
+            self.event_repo.get_event_meta(event_id=event_id),
+            self.event_repo.list_registrations(event_id=event_id, status="active"),
+        )
         if not ev:
             await interaction.followup.send(embed=self.embeds.error(title="Not found", description="Event not found."))
             return
 
-        status = str(ev.get("status") or "").lower()
+        status = ev.status
         if status not in ("open", "locked", "draft"):
             await interaction.followup.send(embed=self.embeds.warning(title="Invalid state", description=f"Event is `{status}`."))
             return
 
-        existing = await self.event_repo.list_event_teams(event_id=event_id)
-        if existing:
-            await interaction.followup.send(embed=self.embeds.warning(title="Already created", description="Event teams already exist."))
-            return
-
-        team_size = int(ev.get("team_size") or 2)
-        max_players = int(ev.get("max_players") or 48)
+        team_size = ev.team_size
+        max_players = ev.max_players
 
-        regs = await self.event_repo.list_registrations(event_id=event_id)
-        active = [r for r in regs if str(r.get("status") or "").lower() == "active"]
         if len(active) < team_size * 2:
             await interaction.followup.send(embed=self.embeds.warning(title="Not enough players", description=f"Need at least {team_size*2} active registrations."))
             return
@@ -837,52 +1109,64 @@ class EventsCog(commands.Cog):
             )
             return
 
-        random.shuffle(active)
+        _TEAM_RNG.shuffle(active)
 
-        # ---- SPIN VISUAL (HYPE MOMENT) ----
-        display_names = [
-            str(r.get("display_name") or r.get("account_id"))
-            for r in active
+        # one name per player, shared by the team names and the spin so both always agree
+        display_names = [str(r.get("display_name") or r.get("account_id")) for r in active]
+
+        team_starts = range(0, len(active), team_size)
+        team_md = {"generated": True}  # shared: serialized once for all teams
+        teams = [
+            (
+                _join_bounded(display_names[i : i + team_size]),
+                team_no,
+                team_md,
+                [(int(r["account_id"]), "starter", slot) for slot, r in enumerate(active[i : i + team_size], start=1)],
+            )
+            for team_no, i in enumerate(team_starts, start=1)
         ]
 
-        await self._spin_visual(
-            interaction=interaction,
-            title="D2 Hustlers — Team Randomizer",
-            names=display_names,
-            frames=16,      # adjust safely
-            delay=0.22,     # adjust speed
+        # ---- SPIN VISUAL (HYPE MOMENT) ----
+        # Teams are already decided; the ~3.5s animation runs while the writes go out.
+        spin_task = asyncio.create_task(
+            self._spin_visual(
+                interaction=interaction,
+                title="D2 Hustlers — Team Randomizer",
+                names=display_names,
+                frames=16,      # adjust safely
+                delay=0.22,     # adjust speed
+            )
         )
         # ---------------------------------
 
-
-        created_team_ids: list[int] = []
-        team_no = 1
-        for i in range(0, len(active), team_size):
-            chunk = active[i : i + team_size]
-            names = [str(c.get("display_name") or c.get("account_id")) for c in chunk]
-            display_name = " + ".join(names)[:128]
-
-            event_team_id = await self.event_repo.create_event_team(
-                event_id=event_id,
-                base_team_id=None,
-                display_name=display_name,
-                seed=team_no,
-                metadata={"generated": True},
+        # teams + members + status lock in one transaction (nothing half-written on failure).
+        # uk_event_team_seed (event_id, seed) refuses a second run, so no existence SELECT is needed.
+        created_team_ids: Optional[list[int]] = None
+        try:
+            created_team_ids = await self.event_repo.create_event_teams_with_members(
+                event_id=event_id, teams=teams, status="locked"
             )
-            created_team_ids.append(event_team_id)
-
-            for slot, r in enumerate(chunk, start=1):
-                await self.event_repo.add_event_team_member(
-                    event_team_id=event_team_id,
-                    account_id=int(r["account_id"]),
-                    role="starter",
-                    slot=slot,
-                    metadata=None,
-                )
-
-            team_no += 1
+            self._invalidate_event_reads(event_id)
+        except aiomysql.IntegrityError as exc:
+            spin_task.cancel()
+            await asyncio.gather(spin_task, return_exceptions=True)
+            if _is_duplicate_key(exc, "uk_event_team_seed"):
+                await interaction.followup.send(embed=self.embeds.warning(title="Already created", description="Event teams already exist."))
+                return
+            log.exception("Creating teams failed for event %s", event_id)
+            await interaction.followup.send(
+                embed=self.embeds.error(title="Team creation failed", description="Nothing was saved. Check the bot logs.")
+            )
+            return
+        finally:
+            # any other failure (or cancellation) still stops the animation
+            if created_team_ids is None and not spin_task.done():
+                spin_task.cancel()
 
-        await self.event_repo.set_event_status(event_id=event_id, status="locked")
+        # the teams are saved either way; a failed animation edit must not hide that
+        (spin_result,) = await asyncio.gather(spin_task, return_exceptions=True)
+        if isinstance(spin_result, BaseException):
+            log.warning("Spin animation failed for event %s", event_id, exc_info=spin_result)
 
         e = self.embeds.success(
             title="Teams created",
@@ -891,29 +1175,28 @@ class EventsCog(commands.Cog):
         await interaction.followup.send(embed=e)
 
     @event.command(name="create_bracket", description="Generate the bracket matches from event teams.")
+    @_manager_only()
     async def create_bracket(self, interaction: discord.Interaction, event_id: int) -> None:
         # rate-limit heavy command
         if not await self._rate_limit_heavy(interaction, command_name="create_bracket", event_id=event_id):
             return
 
-        if not await self._can_manage(interaction):
-            await interaction.response.send_message("Missing permission to manage events here.", ephemeral=True)
-            return
-
         await interaction.response.defer(ephemeral=False)
 
+        self._match_cache.invalidate(event_id)
         try:
             await self.brackets.create_bracket(event_id=event_id)
         except Exception as ex:
+            self._invalidate_event_reads(event_id)  # may have written some matches before failing
             await interaction.followup.send(embed=self.embeds.error(title="Bracket error", description=str(ex)))
             return
 
         await self.event_repo.set_event_status(event_id=event_id, status="active")
+        self._invalidate_event_reads(event_id)
         await interaction.followup.send(embed=self.embeds.success(title="Bracket created", description=f"Bracket generated for event `{event_id}`."))
 
         if isinstance(interaction.channel, discord.TextChannel):
-            await self._upsert_bracket_image_post(event_id, interaction.channel)
-            await self._upsert_current_round_image_post(event_id, interaction.channel)
+            self._schedule_image_refresh(event_id, interaction.channel)
 
     @event.command(name="bracket_image", description="Show the current bracket as a drawn PNG.")
     async def bracket_image(self, interaction: discord.Interaction, event_id: int) -> None:
@@ -923,28 +1206,19 @@ class EventsCog(commands.Cog):
 
         await interaction.response.defer(ephemeral=False)
 
-        ev = await self.event_repo.get_event(event_id=event_id)
+        # event, teams and matches in parallel; an unknown event just wastes two cheap reads
+        ev, teams_by_seed, matches = await self._load_render_inputs(event_id)
         if not ev:
             await interaction.followup.send(embed=self.embeds.error(title="Not found", description="Event not found."))
             return
 
-        teams_by_seed = await self._build_teams_by_seed(event_id)
-        matches = await self.event_repo.list_matches(event_id=event_id)
-
         if not teams_by_seed:
             await interaction.followup.send(embed=self.embeds.warning(title="No teams", description="No event teams found yet."))
             return
 
-        png = self.bracket_diagram.render_png(
-            event_id=event_id,
-            event_format=str(ev.get("format") or "double_elim"),
-            teams_by_seed=teams_by_seed,
-            matches=list(matches or []),
-            title=f"Event {event_id} Bracket",
-        )
+        png = await self._bracket_png(event_id, ev, teams_by_seed, matches)
 
-        fp = BytesIO(png)
-        await interaction.followup.send(file=discord.File(fp, filename=f"event_{event_id}_bracket.png"))
+        await interaction.followup.send(file=_bytes_file(png, f"event_{event_id}_bracket.png"))
 
     @event.command(name="current_round", description="Show current active matches as an easy-to-read image.")
     async def current_round(self, interaction: discord.Interaction, event_id: int) -> None:
@@ -954,18 +1228,17 @@ class EventsCog(commands.Cog):
 
         await interaction.response.defer(ephemeral=False)
 
-        ev = await self.event_repo.get_event(event_id=event_id)
+        ev, teams_by_seed, matches = await self._load_render_inputs(event_id)
         if not ev:
             await interaction.followup.send(embed=self.embeds.error(title="Not found", description="Event not found."))
             return
 
-        png = await self._render_current_round_png_bytes(event_id)
+        png = await self._current_round_png(event_id, ev, teams_by_seed, matches) if teams_by_seed else None
         if not png:
             await interaction.followup.send(embed=self.embeds.warning(title="Nothing to show", description="No active matches found (or no teams yet)."))
             return
 
-        fp = BytesIO(png)
-        await interaction.followup.send(file=discord.File(fp, filename=f"event_{event_id}_current_round.png"))
+        await interaction.followup.send(file=_bytes_file(png, f"event_{event_id}_current_round.png"))
 
     # ---- keep the rest of your commands unchanged below this line ----
 
@@ -973,23 +1246,36 @@ class EventsCog(commands.Cog):
     async def leaderboard(self, interaction: discord.Interaction, event_id: int) -> None:
         await interaction.response.defer(ephemeral=False)
 
-        players = await self.stats.get_player_leaderboard(event_id=event_id)
-        teams = await self.stats.get_team_records(event_id=event_id)
+        players, teams = await asyncio.gather(
+            self.stats.get_player_leaderboard(event_id=event_id),
+            self.stats.get_team_records(event_id=event_id),
+        )
 
         if not players and not teams:
             await interaction.followup.send(embed=self.embeds.warning(title="No stats yet", description="No completed matches/stat lines found."))
             return
 
+        # table building is plain Python; keep it off the event loop
+        parts: list[str] = []
         if players:
-            text_players = self.leaderboard_view.render_players(
-                players,
-                opts=LeaderboardOptions(title=f"Event {event_id}"),
+            parts.append(
+                await asyncio.to_thread(
+                    self.leaderboard_view.render_players,
+                    players,
+                    opts=LeaderboardOptions(title=f"Event {event_id}"),
+                )
             )
-            await interaction.followup.send(content=text_players)
-
         if teams:
-            text_teams = self.leaderboard_view.render_teams(teams, title=f"Event {event_id}")
-            await interaction.followup.send(content=text_teams)
+            parts.append(await asyncio.to_thread(self.leaderboard_view.render_teams, teams, title=f"Event {event_id}"))
+
+        # one message when both tables fit (Discord content limit is 2000 chars)
+        combined = "\n".join(parts)
+        if len(combined) <= 2000:
+            await interaction.followup.send(content=combined)
+            return
+
+        for text in parts:
+            await interaction.followup.send(content=text)
 
     @event.command(name="report", description="Report a match winner (and advance bracket).")
     @app_commands.describe(
@@ -1001,11 +1287,22 @@ class EventsCog(commands.Cog):
         if not interaction.guild:
             await interaction.response.send_message("Use this in a server.", ephemeral=True)
             return
+
+        # malformed codes never reach the DB (MATCH_CODE_RE is compiled once in bracket_service)
+        try:
+            match_key = parse_match_code(match_code)
+        except BracketStateError as ex:
+            await interaction.response.send_message(
+                embed=self.embeds.error(title="Report failed", description=str(ex)),
+                ephemeral=True,
+            )
+            return
+
         await interaction.response.defer(ephemeral=False)
 
         reporter = await self._ensure_account_id(interaction.user)
 
-        m = await self.event_repo.get_match_by_code(event_id=event_id, match_code=match_code)
+        m = await self._get_match_ref(event_id, match_key)
         if not m:
             await interaction.followup.send(
                 embed=self.embeds.error(
@@ -1015,20 +1312,30 @@ class EventsCog(commands.Cog):
             )
             return
 
-        row = await self.event_repo.fetch_one(
-            "SELECT event_team_id FROM event_team WHERE event_id=%s AND seed=%s;",
-            (int(event_id), int(winner_seed)),
-        )
-        if not row:
+        # only the two teams in this match can win it; seeds are denormalized onto the match row
+        if m.get("team1_seed") is not None:
+            team_id_by_seed = {
+                int(m[f"team{i}_seed"]): int(m[f"team{i}_event_team_id"])
+                for i in (1, 2)
+                if m.get(f"team{i}_seed") is not None and m.get(f"team{i}_event_team_id") is not None
+            }
+        else:
+            # rows created before migration 004
+            teams = await self.event_repo.get_event_teams_by_ids(
+                event_team_ids=[m.get("team1_event_team_id"), m.get("team2_event_team_id")]
+            )
+            team_id_by_seed = {int(t["seed"]): int(t["event_team_id"]) for t in teams if t.get("seed") is not None}
+
+        winner_event_team_id = team_id_by_seed.get(int(winner_seed))
+        if winner_event_team_id is None:
             await interaction.followup.send(
                 embed=self.embeds.error(
                     title="Report failed",
-                    description=f"Winner seed `{winner_seed}` not found for event `{event_id}`.",
+                    description=f"Winner seed `{winner_seed}` is not playing in `{str(match_code).upper()}`.",
                 )
             )
             return
 
-        winner_event_team_id = int(row["event_team_id"])
         match_id = int(m["event_match_id"])
 
         try:
@@ -1038,10 +1345,16 @@ class EventsCog(commands.Cog):
                 reported_by_account_id=reporter,
                 player_stats=None,
                 metadata={"source": "discord", "match_code": str(match_code).upper(), "winner_seed": int(winner_seed)},
+                match_row={**m, "event_id": event_id},
             )
         except Exception as ex:
             await interaction.followup.send(embed=self.embeds.error(title="Report failed", description=str(ex)))
             return
+        finally:
+            # report_match advances the bracket and may complete the event, even when it raises late
+            self._invalidate_event_reads(event_id)
+
+        m["status"] = "completed"
 
         await interaction.followup.send(
             embed=self.embeds.success(
@@ -1051,8 +1364,7 @@ class EventsCog(commands.Cog):
         )
 
         if isinstance(interaction.channel, discord.TextChannel):
-            await self._upsert_bracket_image_post(event_id, interaction.channel)
-            await self._upsert_current_round_image_post(event_id, interaction.channel)
+            self._schedule_image_refresh(event_id, interaction.channel)
 
 
 
@@ -1067,6 +1379,7 @@ async def setup(
     bracket_view: BracketView,
     leaderboard_view: LeaderboardView,
     bracket_diagram: BracketDiagramRenderer,
+    settings_cache: TTLCache,
 ) -> None:
     await bot.add_cog(
         EventsCog(
@@ -1079,5 +1392,6 @@ async def setup(
             bracket_view=bracket_view,
             leaderboard_view=leaderboard_view,
             bracket_diagram=bracket_diagram,
+            settings_cache=settings_cache,
         )
     )
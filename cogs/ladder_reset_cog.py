@@ -46,13 +46,14 @@ class LadderResetCog(commands.Cog):
         captain_id = await self._ensure_account_id(interaction.user)
 
         try:
-            team_id = await self.team_repo.create_team(
+            team_id = await self.team_repo.create_team_with_members(
                 guild_channel_id=guild_channel_id,
                 context=LADDER_CONTEXT,
                 name=name.strip()[:128],
                 tag=(tag.strip()[:16] if tag else None),
                 captain_account_id=captain_id,
                 metadata={"source": "discord"},
+                members=[(captain_id, "starter", 1, None)],
             )
         except aiomysql.IntegrityError:
             await interaction.followup.send(
@@ -61,8 +62,6 @@ class LadderResetCog(commands.Cog):
             )
             return
 
-        await self.team_repo.add_member(team_id=team_id, account_id=captain_id, role="starter", slot=1, metadata=None)
-
         e = self.embeds.success(title="Team created", description=f"**{name}** created. Team ID: `{team_id}`")
         await interaction.followup.send(embed=e, ephemeral=True)
 
@@ -2,9 +2,24 @@
 from __future__ import annotations
 
 import os
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+# KEY=value per line: optional `export`, "double" (backslash escapes), 'single' (literal) or bare
+# values, trailing `# comment` (after a bare value only when preceded by whitespace, so a `#`
+# inside a password survives). [ \t] rather than \s so a match never runs onto the next line.
+_ENV_LINE = re.compile(
+    r"""^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"""
+    r"""(?:(?:"((?:[^"\\\n]|\\.)*)"|'([^'\n]*)')[ \t]*(?:#.*)?|(.*?)(?:[ \t]+#.*)?[ \t]*)$""",
+    re.MULTILINE,
+)
+_ENV_ESCAPE = re.compile(r"\\(.)")
+_ENV_ESCAPES = {"n": "\n", "t": "\t"}
+
+_env_loaded = False
+
 
 def _maybe_load_env_file() -> None:
     """
@@ -13,7 +28,13 @@ def _maybe_load_env_file() -> None:
     - If python-dotenv is installed, use it.
     - Otherwise, fall back to a tiny parser.
     - Never overwrites already-set environment variables.
+    - Runs once per process.
     """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+
     dotenv_path = Path(__file__).resolve().parent / ".env"
     if not dotenv_path.exists():
         return
@@ -27,14 +48,13 @@ def _maybe_load_env_file() -> None:
         pass
 
     # Fallback parser
-    for raw in dotenv_path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        k, v = line.split("=", 1)
-        k = k.strip()
-        v = v.strip().strip('"').strip("'")
-        if k and k not in os.environ:
+    for m in _ENV_LINE.finditer(dotenv_path.read_text(encoding="utf-8")):
+        k, dq, sq, bare = m.groups()
+        if dq is not None:
+            v = _ENV_ESCAPE.sub(lambda e: _ENV_ESCAPES.get(e.group(1), e.group(1)), dq)
+        else:
+            v = sq if sq is not None else bare
+        if k not in os.environ:
             os.environ[k] = v
 
 
@@ -45,9 +65,10 @@ class MySqlConfig:
     user: str
     password: str
     database: str
-    minsize: int = 1
-    maxsize: int = 5
+    minsize: int = 5
+    maxsize: int = 25
     connect_timeout: int = 10
+    pool_recycle: int = 300
 
 
 @dataclass(frozen=True)
@@ -86,8 +107,13 @@ def _int(value: str | None, var_name: str, default: int) -> int:
         raise ValueError(f"{var_name} must be an integer, got: {value!r}") from e
 
 
+@lru_cache(maxsize=1)
 def load_config() -> BotConfig:
-    _maybe_load_env_file()  # <--- add this line
+    """
+    Built once per process; later calls return the same (frozen) BotConfig.
+    Failures aren't cached, so a fixed environment can be retried.
+    """
+    _maybe_load_env_file()
 
     token = (_getenv("DISCORD_TOKEN") or "").strip()
     if not token:
@@ -102,9 +128,10 @@ def load_config() -> BotConfig:
     password = _getenv("DB_PASSWORD", "") or ""
     database = _getenv("DB_NAME", "d2_discord_bot") or "d2_discord_bot"
 
-    minsize = _int(_getenv("DB_POOL_MIN"), "DB_POOL_MIN", 1)
-    maxsize = _int(_getenv("DB_POOL_MAX"), "DB_POOL_MAX", 5)
+    minsize = _int(_getenv("DB_POOL_MIN"), "DB_POOL_MIN", 5)
+    maxsize = _int(_getenv("DB_POOL_MAX"), "DB_POOL_MAX", 25)
     connect_timeout = _int(_getenv("DB_CONNECT_TIMEOUT"), "DB_CONNECT_TIMEOUT", 10)
+    pool_recycle = _int(_getenv("DB_POOL_RECYCLE"), "DB_POOL_RECYCLE", 300)
 
     if minsize < 1:
         raise ValueError("DB_POOL_MIN must be >= 1")
@@ -126,5 +153,6 @@ def load_config() -> BotConfig:
             minsize=minsize,
             maxsize=maxsize,
             connect_timeout=connect_timeout,
+            pool_recycle=pool_recycle,
         ),
     )
@@ -1,10 +1,20 @@
 # db/pool.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, fields
+from typing import Any, AsyncIterator, Optional
 
 import aiomysql
+from pymysql.constants import FIELD_TYPE
+from pymysql.converters import conversions
+
+from utils.json_util import json_loads
+
+# Default pymysql decoders, plus JSON columns decoded once at fetch time (rows carry dicts, not text)
+_CONVERSIONS: dict[Any, Any] = {**conversions, FIELD_TYPE.JSON: json_loads}
 
 
 @dataclass(frozen=True)
@@ -14,9 +24,18 @@ class MySqlPoolConfig:
     user: str
     password: str
     database: str
-    minsize: int = 1
-    maxsize: int = 5
+    minsize: int = 5   # warm connections kept open
+    maxsize: int = 25  # keep well under the server's max_connections
     connect_timeout: int = 10
+    pool_recycle: int = 300  # seconds idle before a pooled connection is replaced (-1 = never)
+
+    @classmethod
+    def from_config(cls, mysql: Any) -> MySqlPoolConfig:
+        """
+        From config.MySqlConfig (same field names). A shallow field copy: asdict() would
+        deep-copy every value only for it to be splatted straight back into a dataclass.
+        """
+        return cls(**{f.name: getattr(mysql, f.name) for f in fields(cls)})
 
 
 class DbPool:
@@ -25,10 +44,15 @@ class DbPool:
     - Create once at startup
     - Reuse pool everywhere (repositories)
     - Close on shutdown
+
+    acquire() gates checkouts with a semaphore sized to maxsize, so callers queue here
+    (visible as stats()["waiting"]) rather than inside aiomysql.
     """
 
     def __init__(self) -> None:
         self._pool: Optional[aiomysql.Pool] = None
+        self._sema: Optional[asyncio.Semaphore] = None
+        self._waiting = 0
 
     @property
     def pool(self) -> aiomysql.Pool:
@@ -49,25 +73,74 @@ class DbPool:
             minsize=cfg.minsize,
             maxsize=cfg.maxsize,
             connect_timeout=cfg.connect_timeout,
+            pool_recycle=cfg.pool_recycle,
             autocommit=True,  # repositories can do single statements without explicit commit
             charset="utf8mb4",
+            conv=_CONVERSIONS,
         )
 
+        self._sema = asyncio.Semaphore(cfg.maxsize)
+
         # sanity check connection works immediately
         await self.ping()
+        logging.info(
+            "DB pool started: %s@%s:%s/%s min=%d max=%d recycle=%ss",
+            cfg.user, cfg.host, cfg.port, cfg.database, cfg.minsize, cfg.maxsize, cfg.pool_recycle,
+        )
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiomysql.Connection]:
+        """
+        Check out a connection (same shape as aiomysql.Pool.acquire; db/tx helpers accept either).
+        """
+        sema = self._sema
+        if sema is None:
+            raise RuntimeError("DB pool is not initialized. Call await DbPool.start() first.")
+
+        if sema.locked():
+            self._waiting += 1
+            if self._waiting % 10 == 1:
+                logging.warning("DB pool saturated: %d callers waiting for a connection", self._waiting)
+            try:
+                await sema.acquire()
+            finally:
+                self._waiting -= 1
+        else:
+            await sema.acquire()
+
+        try:
+            async with self.pool.acquire() as conn:
+                yield conn
+        finally:
+            sema.release()
 
     async def ping(self) -> None:
         """
         Verifies pool is usable. Raises if not.
         """
-        async with self.pool.acquire() as conn:
+        async with self.acquire() as conn:
             async with conn.cursor() as cur:
                 await cur.execute("SELECT 1;")
                 await cur.fetchone()
 
+    def stats(self) -> dict[str, Any]:
+        """
+        Point-in-time pool usage (for ops / saturation checks).
+        """
+        p = self.pool
+        return {
+            "size": p.size,
+            "free": p.freesize,
+            "in_use": p.size - p.freesize,
+            "minsize": p.minsize,
+            "maxsize": p.maxsize,
+            "waiting": self._waiting,
+        }
+
     async def close(self) -> None:
         if self._pool is None:
             return
         self._pool.close()
         await self._pool.wait_closed()
         self._pool = None
+        self._sema = None
@@ -1,14 +1,23 @@
 # db/tx.py
 from __future__ import annotations
 
+import logging
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Tuple
+from typing import TYPE_CHECKING, AsyncIterator, Tuple, Union
 
 import aiomysql
 
+if TYPE_CHECKING:
+    from db.pool import DbPool
+
+log = logging.getLogger(__name__)
+
+# Anything with an async-context acquire(): DbPool (semaphore-gated) or a raw aiomysql.Pool
+PoolLike = Union["DbPool", aiomysql.Pool]
+
 
 @asynccontextmanager
-async def get_conn(pool: aiomysql.Pool) -> AsyncIterator[aiomysql.Connection]:
+async def get_conn(pool: PoolLike) -> AsyncIterator[aiomysql.Connection]:
     """
     Acquire a connection from the pool.
     """
@@ -18,13 +27,20 @@ async def get_conn(pool: aiomysql.Pool) -> AsyncIterator[aiomysql.Connection]:
 
 @asynccontextmanager
 async def get_cursor(
-    pool: aiomysql.Pool, *, dict_rows: bool = True
+    pool: PoolLike, *, dict_rows: bool = True, streaming: bool = False
 ) -> AsyncIterator[aiomysql.Cursor]:
     """
     Acquire a cursor (defaults to DictCursor for clean repo code).
     Autocommit should be True at pool level; this is for simple read/write statements.
+
+    streaming=True uses an unbuffered (SS*) cursor: rows are read off the socket as you iterate
+    (`async for row in cur`) instead of the whole result being buffered first. Consume it fully
+    inside the block; the connection is busy until you do.
     """
-    cursor_cls = aiomysql.DictCursor if dict_rows else aiomysql.Cursor
+    if streaming:
+        cursor_cls = aiomysql.SSDictCursor if dict_rows else aiomysql.SSCursor
+    else:
+        cursor_cls = aiomysql.DictCursor if dict_rows else aiomysql.Cursor
     async with pool.acquire() as conn:
         async with conn.cursor(cursor_cls) as cur:
             yield cur
@@ -32,7 +48,7 @@ async def get_cursor(
 
 @asynccontextmanager
 async def transaction(
-    pool: aiomysql.Pool, *, dict_rows: bool = True
+    pool: PoolLike, *, dict_rows: bool = True
 ) -> AsyncIterator[Tuple[aiomysql.Connection, aiomysql.Cursor]]:
     """
     Runs statements inside a transaction.
@@ -57,3 +73,54 @@ async def transaction(
         except Exception:
             await conn.rollback()
             raise
+
+
+@asynccontextmanager
+async def transaction_bulk(
+    pool: PoolLike, *, dict_rows: bool = True, skip_fk_checks: bool = True, skip_unique_checks: bool = False
+) -> AsyncIterator[Tuple[aiomysql.Connection, aiomysql.Cursor]]:
+    """
+    transaction() for known-safe bulk loads, with per-session constraint checks relaxed.
+
+    - skip_fk_checks: only when every referenced id was just created/verified by the caller
+    - skip_unique_checks: InnoDB may then let duplicates into secondary UNIQUE indexes, which
+      also breaks ON DUPLICATE KEY upserts; only for plain INSERTs of rows known to be unique
+    Never for user-submitted data. The settings that were switched off are restored before the
+    connection goes back to the pool; if switching them off or restoring them fails (or is
+    cancelled part-way) the connection is closed instead of reused.
+    """
+    toggles = [name for name, on in (("foreign_key_checks", skip_fk_checks), ("unique_checks", skip_unique_checks)) if on]
+    cursor_cls = aiomysql.DictCursor if dict_rows else aiomysql.Cursor
+
+    async with pool.acquire() as conn:
+        changed: list[str] = []
+        try:
+            async with conn.cursor() as setup:
+                for name in toggles:
+                    await setup.execute(f"SET SESSION {name}=0;")
+                    changed.append(name)
+        except BaseException:
+            # a SET that failed or was cancelled in flight leaves the session state unknown
+            conn.close()
+            raise
+
+        try:
+            await conn.begin()
+            try:
+                async with conn.cursor(cursor_cls) as cur:
+                    yield conn, cur
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        finally:
+            # restore only what was switched off; never hand the connection back with checks off
+            try:
+                async with conn.cursor() as setup:
+                    for name in changed:
+                        await setup.execute(f"SET SESSION {name}=1;")
+            except BaseException as exc:
+                conn.close()
+                log.warning("Restoring %s failed; connection closed", ", ".join(changed), exc_info=True)
+                if not isinstance(exc, Exception):
+                    raise
@@ -1,21 +1,24 @@
 # domain/enums.py
 from __future__ import annotations
 
-from enum import Enum
+from enum import StrEnum
 
+# StrEnum (3.11+): members are real strs, str()/format() give the bare value.
+# Values are source literals, so CPython already interns them; no sys.intern needed.
 
-class BracketKey(str, Enum):
+
+class BracketKey(StrEnum):
     W = "W"     # Winners
     L = "L"     # Losers
     GF = "GF"   # Grand Finals
 
 
-class EventFormat(str, Enum):
+class EventFormat(StrEnum):
     SINGLE = "single_elim"
     DOUBLE = "double_elim"
 
 
-class MatchStatus(str, Enum):
+class MatchStatus(StrEnum):
     PENDING = "pending"
     OPEN = "open"
     COMPLETED = "completed"
@@ -0,0 +1,35 @@
+# domain/event_meta.py
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+from utils.json_util import json_obj
+
+
+@dataclass(frozen=True, slots=True)
+class EventMeta:
+    """
+    The event fields commands branch on, normalized once per fetch
+    (status/format lowercased, schema defaults filled, metadata parsed).
+    """
+    event_id: int
+    name: str
+    status: str
+    format: str
+    team_size: int
+    max_players: int
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+def to_event_meta(row: Mapping[str, Any]) -> EventMeta:
+    # defaults mirror the event table's column defaults
+    return EventMeta(
+        event_id=int(row["event_id"]),
+        name=str(row.get("name") or ""),
+        status=str(row.get("status") or "draft").lower(),
+        format=str(row.get("format") or "double_elim").lower(),
+        team_size=int(row.get("team_size") or 2),
+        max_players=int(row.get("max_players") or 48),
+        metadata=json_obj(row.get("metadata")),
+    )
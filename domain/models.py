@@ -1,53 +1,65 @@
 # domain/models.py
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 from domain.enums import BracketKey
 
 
+# (bracket, round, match) space is tiny and the renderers ask for the same codes every redraw.
+# Interned so equal codes are one object however they were asked for ("W" vs BracketKey.W,
+# or after a cache eviction): cheap dict-key hits and identity-fast ==.
+@lru_cache(maxsize=4096)
 def match_code(bracket: str, round_no: int, match_no: int) -> str:
     b = bracket.upper()
     if b == "GF":
-        return f"GF-{match_no:02d}"
-    return f"{b}{round_no}-{match_no:02d}"
+        return sys.intern(f"GF-{match_no:02d}")
+    return sys.intern(f"{b}{round_no}-{match_no:02d}")
 
 
+@lru_cache(maxsize=64)
 def next_power_of_two(n: int) -> int:
-    if n <= 1:
-        return 1
-    p = 1
-    while p < n:
-        p <<= 1
-    return p
+    return 1 if n <= 1 else 1 << (n - 1).bit_length()
 
 
-def seeded_positions(n: int) -> list[int]:
+@lru_cache(maxsize=32)
+def seeded_positions(n: int) -> tuple[int, ...]:
     """
-    Standard tournament seeding positions list (length n, n is power of two).
-    Example n=8 => [1,8,4,5,2,7,3,6]
+    Standard tournament seeding positions (length n, n is power of two).
+    Example n=8 => (1,8,4,5,2,7,3,6)
+    Cached per n, hence a tuple: the same object is handed to every caller.
     """
     if n <= 1:
-        return [1]
-    if n == 2:
-        return [1, 2]
-    prev = seeded_positions(n // 2)
-    out: list[int] = []
-    for s in prev:
-        out.append(s)
-        out.append(n + 1 - s)
-    return out
-
-
-@dataclass(frozen=True)
+        return (1,)
+    if n & (n - 1):
+        raise ValueError(f"seeded_positions needs a power of two, got {n} (use next_power_of_two)")
+    # Same doubling as [s, size+1-s for s in prev], done in one buffer: each pass expands the
+    # first size/2 slots into the first size, back to front so nothing is overwritten before it's read.
+    out = [0] * n
+    out[0] = 1
+    size = 1
+    while size < n:
+        size <<= 1
+        for i in range((size >> 1) - 1, -1, -1):
+            s = out[i]
+            out[2 * i] = s
+            out[2 * i + 1] = size + 1 - s
+    return tuple(out)
+
+
+# Not frozen (frozen __init__ goes through object.__setattr__ per field); still hashable by
+# value, so treat instances as read-only.
+@dataclass(slots=True, unsafe_hash=True)
 class TeamRef:
     seed: int
     name: str
     event_team_id: Optional[int] = None  # present when known
 
 
-@dataclass
+@dataclass(slots=True)
 class BracketNode:
     bracket: BracketKey
     round_no: int
@@ -64,6 +76,12 @@ class BracketNode:
     status: str = "pending"
     winner_event_team_id: Optional[int] = None
 
+    # bracket/round_no/match_no are fixed after construction, so the code is built once
+    _code: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._code = match_code(self.bracket.value, self.round_no, self.match_no)
+
     @property
     def code(self) -> str:
-        return match_code(self.bracket.value, self.round_no, self.match_no)
+        return self._code
@@ -4,31 +4,31 @@ from __future__ import annotations
 import asyncio
 import logging
 import signal
-from dataclasses import asdict
 from typing import Optional
 
 import discord
+from discord import app_commands
 from discord.ext import commands
 
 from config import load_config
 from db.pool import DbPool, MySqlPoolConfig
 
-from repositories.identity_repo import IdentityRepo
-from repositories.team_repo import TeamRepo
-from repositories.event_repo import EventRepo
-from repositories.stats_repo import StatsRepo
+# Optional libuv event loop (POSIX only; falls back to the default asyncio loop)
+try:
+    import uvloop  # type: ignore
+except Exception:  # pragma: no cover
+    uvloop = None  # type: ignore
 
-from services.bracket_service import BracketService
-from services.stats_service import StatsService
 
-from renderers.embeds import Embeds
-from renderers.bracket_view import BracketView
-from renderers.leaderboard_view import LeaderboardView
-from renderers.bracket_diagram import BracketDiagramRenderer  # <-- ADD
+class D2HCommandTree(app_commands.CommandTree):
+    async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError) -> None:
+        # runs after the cog's cog_app_command_error; permission denials were already answered
+        # there, so keep them out of the log instead of a traceback each
+        from cogs.events_cog import NotEventManager
 
-from cogs.admin_cog import setup as setup_admin_cog
-from cogs.events_cog import setup as setup_events_cog
-from cogs.ladder_reset_cog import setup as setup_ladder_cog
+        if isinstance(error, NotEventManager):
+            return
+        await super().on_error(interaction, error)
 
 
 class D2HBot(commands.Bot):
@@ -40,6 +40,7 @@ class D2HBot(commands.Bot):
             command_prefix=self.cfg.command_prefix,
             intents=intents,
             allowed_mentions=discord.AllowedMentions.none(),
+            tree_cls=D2HCommandTree,
         )
 
         self.db: Optional[DbPool] = None
@@ -47,9 +48,29 @@ class D2HBot(commands.Bot):
     async def setup_hook(self) -> None:
         logging.info("Starting setup_hook...")
 
-        # --- DB ---
+        # Imported here, not at module top: nothing else in main.py needs them, so `python main.py`
+        # reaches the event loop sooner and any import-time logging happens after basicConfig.
+        from repositories.identity_repo import IdentityRepo
+        from repositories.team_repo import TeamRepo
+        from repositories.event_repo import EventRepo
+        from repositories.stats_repo import StatsRepo
+
+        from services.bracket_service import BracketService
+        from services.stats_service import StatsService
+
+        from renderers.embeds import Embeds
+        from renderers.bracket_view import BracketView
+        from renderers.leaderboard_view import LeaderboardView
+        from renderers.bracket_diagram import BracketDiagramRenderer
+
+        from utils.cache import TTLCache
+
+        from cogs.admin_cog import setup as setup_admin_cog
+        from cogs.events_cog import setup as setup_events_cog
+        from cogs.ladder_reset_cog import setup as setup_ladder_cog
+
+        # --- DB --- (started below, alongside cog setup; nothing queries it before setup_hook returns)
         self.db = DbPool()
-        await self.db.start(MySqlPoolConfig(**asdict(self.cfg.mysql)))
 
         # --- Repos ---
         identity_repo = IdentityRepo(self.db)
@@ -71,20 +92,30 @@ class D2HBot(commands.Bot):
         leaderboard_view = LeaderboardView()
         bracket_diagram = BracketDiagramRenderer()  # <-- ADD
 
-        # --- Cogs ---
-        await setup_admin_cog(self, identity_repo=identity_repo, embeds=embeds)
-        await setup_events_cog(
-            self,
-            identity_repo=identity_repo,
-            event_repo=event_repo,
-            bracket_service=bracket_service,
-            stats_service=stats_service,
-            embeds=embeds,
-            bracket_view=bracket_view,
-            leaderboard_view=leaderboard_view,
-            bracket_diagram=bracket_diagram,  # <-- ADD
+        # --- Caches ---
+        # guild settings change only via /admin; short TTL bounds staleness if another process edits them
+        settings_cache = TTLCache(maxsize=512, ttl=60.0)
+
+        # --- Pool + cogs, concurrently ---
+        # Cog setup is independent per cog (separate command groups) and only needs the DbPool
+        # object, not an open pool; interactions can't arrive until setup_hook has returned.
+        await asyncio.gather(
+            self.db.start(MySqlPoolConfig.from_config(self.cfg.mysql)),
+            setup_admin_cog(self, db=self.db, identity_repo=identity_repo, embeds=embeds, settings_cache=settings_cache),
+            setup_events_cog(
+                self,
+                identity_repo=identity_repo,
+                event_repo=event_repo,
+                bracket_service=bracket_service,
+                stats_service=stats_service,
+                embeds=embeds,
+                bracket_view=bracket_view,
+                leaderboard_view=leaderboard_view,
+                bracket_diagram=bracket_diagram,  # <-- ADD
+                settings_cache=settings_cache,
+            ),
+            setup_ladder_cog(self, identity_repo=identity_repo, team_repo=team_repo, embeds=embeds),
         )
-        await setup_ladder_cog(self, identity_repo=identity_repo, team_repo=team_repo, embeds=embeds)
 
         # --- Slash sync ---
         if self.cfg.dev_guild_id:
@@ -136,7 +167,9 @@ async def _run_bot() -> None:
 
 
 def main() -> None:
-    asyncio.run(_run_bot())
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(_run_bot())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,16 @@
+/* migrations/003_event_team_unique_seed.sql
+
+   One seed per event team.
+   /event randomize_teams relies on this key to refuse a second run
+   (instead of checking for existing teams first).
+
+   If an event already has duplicate seeds, fix those rows before running.
+*/
+
+START TRANSACTION;
+
+ALTER TABLE event_team
+  DROP INDEX ix_event_team_seed,
+  ADD UNIQUE KEY uk_event_team_seed (event_id, seed);
+
+COMMIT;
@@ -0,0 +1,21 @@
+/* migrations/004_event_match_seeds.sql
+
+   Denormalize team seeds onto event_match so /event report can map
+   winner_seed -> event_team_id straight from the match row.
+   New rows are filled by EventRepo.create_match; this backfills existing ones.
+*/
+
+START TRANSACTION;
+
+ALTER TABLE event_match
+  ADD COLUMN team1_seed int unsigned DEFAULT NULL AFTER team1_event_team_id,
+  ADD COLUMN team2_seed int unsigned DEFAULT NULL AFTER team2_event_team_id;
+
+UPDATE event_match em
+  LEFT JOIN event_team t1 ON t1.event_team_id = em.team1_event_team_id
+  LEFT JOIN event_team t2 ON t2.event_team_id = em.team2_event_team_id
+SET
+  em.team1_seed = t1.seed,
+  em.team2_seed = t2.seed;
+
+COMMIT;
@@ -0,0 +1,12 @@
+/* migrations/005_event_registration_status_index.sql
+
+   Registrations by status: EventRepo.list_registrations(status="active")
+   filters on (event_id, status) and orders by joined_at, all from this key.
+*/
+
+START TRANSACTION;
+
+ALTER TABLE event_registration
+  ADD KEY ix_event_reg_status_joined (event_id, status, joined_at);
+
+COMMIT;
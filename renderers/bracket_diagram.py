@@ -2,15 +2,154 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from io import BytesIO
 from math import ceil, log2
-from typing import Any, Mapping, Optional
+from typing import Any, Callable, Mapping, Optional
 
 import os
+import threading
 from PIL import Image, ImageDraw, ImageFont
 
 from domain.enums import BracketKey, EventFormat
 from domain.models import BracketNode, match_code, next_power_of_two, seeded_positions
+from utils.cache import TTLCache
+
+# event_match columns the renderers read (_build_nodes / _compute_wl); callers can
+# project list_matches down to these instead of SELECT *.
+MATCH_COLUMNS: tuple[str, ...] = (
+    "bracket",
+    "round_no",
+    "match_no",
+    "status",
+    "team1_event_team_id",
+    "team2_event_team_id",
+    "winner_event_team_id",
+    "loser_event_team_id",
+)
+
+
+def _file_mtime(path: str | None) -> float | None:
+    if not path:
+        return None
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+# Asset caches. mtime is in the key so an edited asset is picked up on the next render.
+# Cached images are shared: never draw on them, copy first.
+@lru_cache(maxsize=4)
+def _load_rgba(path: str, mtime: float) -> Image.Image | None:
+    try:
+        with Image.open(path) as im:
+            return im.convert("RGBA")
+    except Exception:
+        return None
+
+
+def _fit_cover(img: Image.Image, w: int, h: int) -> Image.Image:
+    iw, ih = img.size
+    if iw <= 0 or ih <= 0:
+        return img.resize((w, h))
+    scale = max(w / iw, h / ih)
+    nw, nh = int(iw * scale), int(ih * scale)
+    resized = img.resize((nw, nh), Image.LANCZOS)
+    left = (nw - w) // 2
+    top = (nh - h) // 2
+    return resized.crop((left, top, left + w, top + h))
+
+
+# Backgrounds up to this many pixels (~16 MB RGBA each) go through the _bg_base cache; bigger
+# canvases (large double-elim brackets run to hundreds of MB) are built per render instead of
+# being pinned in memory.
+_BG_CACHE_MAX_PIXELS = 4_000_000
+
+
+@lru_cache(maxsize=4)
+def _bg_base(path: str | None, mtime: float | None, size: tuple[int, int], bg: tuple[int, int, int]) -> Image.Image:
+    # solid fill + cover-fit background image; the LANCZOS resize + composite happen once per size
+    src = _load_rgba(path, mtime) if (path and mtime is not None) else None
+    if src:
+        fitted = _fit_cover(src, size[0], size[1])
+        if fitted.size == size and fitted.getextrema()[3][0] == 255:
+            # opaque and covers the canvas: compositing over the fill would return it unchanged
+            return fitted
+        img = Image.new("RGBA", size, (*bg, 255))
+        img.alpha_composite(fitted, (0, 0))
+        return img
+    return Image.new("RGBA", size, (*bg, 255))
+
+
+@lru_cache(maxsize=16)
+def _load_font(font_path: Optional[str], size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    # one FreeType face per (font, size) per process, shared by the render threads: Pillow holds
+    # the GIL inside its FreeType calls, so two threads never use a face at the same time
+    try:
+        if font_path:
+            return ImageFont.truetype(font_path, size)
+        for name in ("DejaVuSansMono.ttf", "Consolas.ttf", "consola.ttf", "Courier New.ttf"):
+            try:
+                return ImageFont.truetype(name, size)
+            except Exception:
+                continue
+    except Exception:
+        pass
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=2048)
+def _fit_text(text: str, font: ImageFont.FreeTypeFont | ImageFont.ImageFont, max_w: int) -> str:
+    """
+    text (stripped), or its longest prefix + "…" that fits max_w px. Binary search on the prefix
+    length, so ~log2(len) measurements instead of one per dropped char. font is one of the
+    _load_font faces, so it is a stable cache key; names repeat across rounds and the Teams panel.
+    """
+    t = (text or "").strip()
+    if not t:
+        return ""
+    if font.getlength(t) <= max_w:
+        return t
+    lo, hi = 0, len(t) - 1  # longest n in [lo, hi] with t[:n] + "…" fitting
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if font.getlength(t[:mid] + "…") <= max_w:
+            lo = mid
+        else:
+            hi = mid - 1
+    return (t[:lo] + "…") if lo else "…"
+
+
+_CARD_BANDS = 10
+
+
+@lru_cache(maxsize=8)
+def _card_gradient(w: int, h: int, top: tuple[int, int, int], bot: tuple[int, int, int]) -> Image.Image:
+    """
+    The match card's banded background, (w+1)x(h+1) like the inclusive rectangles it replaces:
+    built as one column then stretched, so a card costs one paste instead of ten rectangles.
+    """
+    col_for_band = []
+    for i in range(_CARD_BANDS):
+        t = i / max(1, _CARD_BANDS - 1)
+        col_for_band.append((
+            int(top[0] * (1 - t) + bot[0] * t),
+            int(top[1] * (1 - t) + bot[1] * t),
+            int(top[2] * (1 - t) + bot[2] * t),
+            235,
+        ))
+    # row r takes the last band starting at or above it (later bands overwrote shared edge rows)
+    starts = [int((h * i) / _CARD_BANDS) for i in range(_CARD_BANDS)]
+    column = []
+    band = 0
+    for r in range(h + 1):
+        while band + 1 < _CARD_BANDS and starts[band + 1] <= r:
+            band += 1
+        column.append(col_for_band[band])
+    strip = Image.new("RGBA", (1, h + 1))
+    strip.putdata(column)
+    return strip.resize((w + 1, h + 1), Image.NEAREST)
 
 
 @dataclass(frozen=True)
@@ -22,8 +161,11 @@ class DiagramStyle:
     h_gap: int = 120
     v_gap: int = 22
 
-    # Render scale (keeps layout math stable; improves readability)
-    scale: float = 1.5  # 1.0, 1.5, 2.0
+    # Render scale (keeps layout math stable; improves readability). Drawing cost grows with
+    # scale squared, so larger output is better had from output_scale than from drawing bigger.
+    scale: float = 1.0  # 1.0, 1.5, 2.0
+    # One LANCZOS resize of the finished image (1.0 = none)
+    output_scale: float = 1.0
 
     # Background (solid fallback if no bg image)
     bg: tuple[int, int, int] = (10, 10, 12)
@@ -55,60 +197,289 @@ class DiagramStyle:
     box_image_path: str | None = None
     winner_box_image_path: str | None = None
 
+    # PNG output: zlib level 0-9 (Pillow's default is 6). Lower levels encode faster but, with the
+    # photo background, come out 20-35% larger, enough to push full brackets past Discord's
+    # attachment limit; only lower it for backgrounds without bg_image_path.
+    png_compress_level: int = 6
+
+
+@dataclass(frozen=True, slots=True)
+class _CardGeom:
+    # match card metrics in px; x offsets from the card's left, y offsets from a panel's top
+    radius: int
+    border_w: int
+    header_h: int
+    inner_gap: int
+    team_h: int
+    glow_h: int
+    badge_dx: int
+    badge_dy: int
+    badge_w: int
+    badge_h: int
+    slot_dx0: int
+    slot_dx1: int
+    slot_h: int
+    slot1_dy: int
+    slot2_dy: int
+
+
+@lru_cache(maxsize=16)
+def _card_geom(w: int, h: int) -> _CardGeom:
+    radius = max(10, int(h * 0.06))
+    header_h = max(26, int(h * 0.16))
+    inner_gap = max(8, int(h * 0.06))
+    team_h = (h - header_h - inner_gap) // 2
+    slot_h = max(22, int(team_h * 0.28))
+    slot_gap = max(8, int(team_h * 0.08))
+    slot1_dy = max(10, int((team_h - (2 * slot_h + slot_gap)) / 2))
+    return _CardGeom(
+        radius=radius,
+        border_w=max(2, int(radius * 0.18)),
+        header_h=header_h,
+        inner_gap=inner_gap,
+        team_h=team_h,
+        glow_h=max(6, int(team_h * 0.10)),
+        badge_dx=max(10, int(w * 0.03)),
+        badge_dy=max(8, int(team_h * 0.08)),
+        badge_w=max(54, int(w * 0.13)),
+        badge_h=max(24, int(team_h * 0.18)),
+        slot_dx0=max(56, int(w * 0.14)),
+        slot_dx1=w - max(18, int(w * 0.05)),
+        slot_h=slot_h,
+        slot1_dy=slot1_dy,
+        slot2_dy=slot1_dy + slot_h + slot_gap,
+    )
+
+
+@lru_cache(maxsize=32)
+def _card_chrome(
+    w: int,
+    h: int,
+    style: DiagramStyle,
+    top_badge: bool,
+    top_winner: bool,
+    bot_badge: bool,
+    bot_winner: bool,
+) -> Image.Image:
+    """
+    Everything on a match card except its text: gradient, borders, header strip, winner glow,
+    seed badges and name slots, (w+1)x(h+1). The rounded rectangles are the expensive part and
+    only vary with the panels' (badge, winner) flags, so each variant is drawn once per size.
+    Shapes replace pixels (no blending), so the sprite is opaque where the card is and
+    _draw_match_card pastes it unmasked; the result matches drawing them on the canvas.
+    """
+    g = _card_geom(w, h)
+    img = _card_gradient(w, h, style.box_fill_top, style.box_fill_bottom).copy()
+    draw = ImageDraw.Draw(img)
+    thin = max(1, g.border_w // 2)
+
+    # outer border + inner bevel
+    draw.rounded_rectangle((0, 0, w, h), radius=g.radius, outline=(*style.box_border, 255), width=g.border_w)
+    draw.rounded_rectangle(
+        (g.border_w, g.border_w, w - g.border_w, h - g.border_w),
+        radius=max(6, g.radius - 1),
+        outline=(*style.box_inner_border, 255),
+        width=thin,
+    )
+
+    # header strip
+    draw.rectangle((0, 0, w, g.header_h), fill=(8, 8, 10, 220))
+    draw.rectangle((0, 0, w, g.header_h), outline=(*style.box_border, 220), width=thin)
+
+    # ember notch
+    notch_w = max(8, int(w * 0.02))
+    draw.rectangle((0, 0, notch_w, g.header_h), fill=(*style.ember, 140))
+
+    top_y = g.header_h
+    bot_y = top_y + g.team_h + g.inner_gap
+    for py, badge, is_winner in ((top_y, top_badge, top_winner), (bot_y, bot_badge, bot_winner)):
+        # winner glow strip
+        if is_winner:
+            draw.rectangle((g.border_w, py + g.border_w, w - g.border_w, py + g.border_w + g.glow_h), fill=(*style.winner_gold, 85))
+
+        # seed badge (top-left); the number is drawn per card
+        if badge:
+            bx0, by0 = g.badge_dx, py + g.badge_dy
+            badge_fill = (*style.blood, 170) if not is_winner else (*style.winner_green, 170)
+            draw.rounded_rectangle(
+                (bx0, by0, bx0 + g.badge_w, by0 + g.badge_h),
+                radius=max(8, g.badge_h // 2),
+                fill=badge_fill,
+                outline=(*style.box_border, 220),
+                width=thin,
+            )
+
+        # inner name slots (two lines)
+        slot_r = max(8, g.slot_h // 3)
+        for sy in (py + g.slot1_dy, py + g.slot2_dy):
+            draw.rounded_rectangle((g.slot_dx0, sy, g.slot_dx1, sy + g.slot_h), radius=slot_r, fill=(10, 10, 12, 190))
+        for sy in (py + g.slot1_dy, py + g.slot2_dy):
+            draw.rounded_rectangle((g.slot_dx0, sy, g.slot_dx1, sy + g.slot_h), radius=slot_r, outline=(*style.box_inner_border, 200), width=thin)
+
+    return img
+
+
+@lru_cache(maxsize=32)
+def _code_tables(bracket_size: int, is_double: bool) -> tuple[tuple[tuple[str, ...], ...], tuple[tuple[str, ...], ...]]:
+    """
+    (w_codes, l_codes): [round_no][match_no] -> match code, index 0 unused (l_codes is ((),)
+    unless double), so layout loops index a table instead of formatting a code per lookup.
+    """
+    k = int(log2(bracket_size))
+    w_codes = ((),) + tuple(
+        ("", *(match_code("W", r, m) for m in range(1, bracket_size // (2**r) + 1))) for r in range(1, k + 1)
+    )
+    l_codes: tuple[tuple[str, ...], ...] = ((),)
+    if is_double:
+        l_codes += tuple(
+            ("", *(match_code("L", r, m) for m in range(1, bracket_size // (2 ** ((r + 1) // 2 + 1)) + 1)))
+            for r in range(1, 2 * (k - 1) + 1)
+        )
+    return w_codes, l_codes
+
+
+@lru_cache(maxsize=32)
+def _bracket_layout(
+    bracket_size: int,
+    is_double: bool,
+    box_w_l: int,
+    box_h_l: int,
+    h_gap_l: int,
+    v_gap_l: int,
+    margin_l: int,
+) -> tuple[tuple[tuple[tuple[int, int], ...], ...], tuple[tuple[tuple[int, int], ...], ...], tuple[int, int] | None, int, int]:
+    """
+    Card positions (logical units) for a bracket shape: (winners_xy, losers_xy, gf_xy, width_l,
+    height_l). winners_xy / losers_xy are indexed [round_no][match_no] like _code_tables (index 0
+    unused), so lookups are list indexing rather than hashing code strings. Only depends on the
+    bracket size/format and the style's box metrics, so every render of a given event reuses it.
+    """
+    k = int(log2(bracket_size))
+    losers_rounds = 2 * (k - 1) if is_double else 0
+    unused = (0, 0)
+
+    winners_xy: list[list[tuple[int, int]]] = [[]]
+    step = (box_h_l + v_gap_l) * 2
+
+    w1_count = bracket_size // 2
+    x = margin_l + 0 * (box_w_l + h_gap_l)
+    winners_xy.append([unused] + [(x, margin_l + (m - 1) * step) for m in range(1, w1_count + 1)])
+
+    for r in range(2, k + 1):
+        match_count = bracket_size // (2**r)
+        x = margin_l + (r - 1) * (box_w_l + h_gap_l)
+        prev = winners_xy[r - 1]
+        winners_xy.append([unused] + [(x, (prev[2 * m - 1][1] + prev[2 * m][1]) // 2) for m in range(1, match_count + 1)])
+
+    max_wy = max(y for row in winners_xy for (_, y) in row[1:])
+    winners_height = max_wy + box_h_l + margin_l
+
+    losers_xy: list[list[tuple[int, int]]] = [[]]
+    losers_offset_y = winners_height + 80
+    gf_xy: tuple[int, int] | None = None
+
+    if is_double and losers_rounds > 0:
+        w1 = winners_xy[1]
+        x = margin_l + 0 * (box_w_l + h_gap_l)
+        losers_xy.append(
+            [unused] + [(x, losers_offset_y + ((w1[2 * m - 1][1] + w1[2 * m][1]) // 2)) for m in range(1, (bracket_size // 4) + 1)]
+        )
+
+        for r in range(2, losers_rounds + 1):
+            stage = (r + 1) // 2
+            match_count = bracket_size // (2 ** (stage + 1))
+            x = margin_l + (r - 1) * (box_w_l + h_gap_l)
+            prev = losers_xy[r - 1]
+
+            if r % 2 == 0:
+                losers_xy.append([unused] + [(x, prev[m][1]) for m in range(1, match_count + 1)])
+            else:
+                losers_xy.append([unused] + [(x, (prev[2 * m - 1][1] + prev[2 * m][1]) // 2) for m in range(1, match_count + 1)])
+
+        gf_x = margin_l + (max(k, losers_rounds)) * (box_w_l + h_gap_l) + 40
+        w_final_y = winners_xy[k][1][1]
+        l_final_y = losers_xy[losers_rounds][1][1]
+        gf_y = (w_final_y + l_final_y) // 2
+        gf_xy = (gf_x, gf_y)
+
+    all_points = [xy for row in winners_xy for xy in row[1:]]
+    if is_double and gf_xy is not None:
+        all_points += [xy for row in losers_xy for xy in row[1:]]
+        all_points.append(gf_xy)
+
+    max_x = max(x for (x, _) in all_points)
+    max_y = max(y for (_, y) in all_points)
+
+    width_l = max_x + box_w_l + margin_l
+    height_l = max_y + box_h_l + margin_l
+
+    # cached and shared: hand out tuples
+    return tuple(map(tuple, winners_xy)), tuple(map(tuple, losers_xy)), gf_xy, width_l, height_l
+
 
 class BracketDiagramRenderer:
+    # finished match cards kept for reuse (~300 KB each at scale 1.0); fits a 64-team double elim
+    CARD_CACHE_SIZE = 160
+    # last few full-bracket and current-round PNGs, keyed on their inputs (see _png_input_key).
+    # Bounded to PNG_CACHE_SIZE * PNG_CACHE_MAX_ITEM_BYTES (~32 MB); bigger PNGs (large double
+    # elims run past 15 MB) are re-rendered rather than pinned, and entries expire after the TTL.
+    PNG_CACHE_SIZE = 8
+    PNG_CACHE_MAX_ITEM_BYTES = 4_000_000
+    PNG_CACHE_TTL_SECONDS = 300.0
+
     def __init__(self, style: DiagramStyle | None = None, font_path: Optional[str] = None) -> None:
         self.style = style or DiagramStyle()
         self.font_path = font_path
 
+        # renders run in worker threads (EventsCog._run_render), and TTLCache isn't thread-safe
+        self._card_cache: TTLCache[tuple, Image.Image] = TTLCache(maxsize=self.CARD_CACHE_SIZE)
+        self._card_cache_style = self.style
+        self._card_cache_lock = threading.Lock()
+
+        self._png_cache: TTLCache[tuple, bytes] = TTLCache(maxsize=self.PNG_CACHE_SIZE, ttl=self.PNG_CACHE_TTL_SECONDS)
+        self._png_cache_style = self.style
+        self._png_cache_lock = threading.Lock()
+
     # -----------------------------
     # Low-level utils
     # -----------------------------
     def _safe_load_rgba(self, path: str | None) -> Image.Image | None:
-        if not path:
-            return None
-        try:
-            if not os.path.exists(path):
-                return None
-            return Image.open(path).convert("RGBA")
-        except Exception:
+        # shared cached image: copy before drawing on it
+        mtime = _file_mtime(path)
+        if mtime is None:
             return None
+        return _load_rgba(path, mtime)
 
     def _fit_cover(self, img: Image.Image, w: int, h: int) -> Image.Image:
-        iw, ih = img.size
-        if iw <= 0 or ih <= 0:
-            return img.resize((w, h))
-        scale = max(w / iw, h / ih)
-        nw, nh = int(iw * scale), int(ih * scale)
-        resized = img.resize((nw, nh), Image.LANCZOS)
-        left = (nw - w) // 2
-        top = (nh - h) // 2
-        return resized.crop((left, top, left + w, top + h))
+        return _fit_cover(img, w, h)
 
     def _font(self, size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
-        try:
-            if self.font_path:
-                return ImageFont.truetype(self.font_path, size)
-            for name in ("DejaVuSansMono.ttf", "Consolas.ttf", "consola.ttf", "Courier New.ttf"):
-                try:
-                    return ImageFont.truetype(name, size)
-                except Exception:
-                    continue
-        except Exception:
-            pass
-        return ImageFont.load_default()
+        return _load_font(self.font_path, size)
+
+    def _png_bytes(self, img: Image.Image) -> bytes:
+        out_s = float(self.style.output_scale or 1.0)
+        if out_s != 1.0:
+            img = img.resize((max(2, int(img.width * out_s)), max(2, int(img.height * out_s))), Image.LANCZOS)
+        buf = BytesIO()
+        img.save(buf, format="PNG", optimize=False, compress_level=self.style.png_compress_level)
+        return buf.getvalue()
 
     def _bg_canvas(self, *, width: int, height: int) -> Image.Image:
         """
         Shared background creation so both full bracket and current-round views look consistent.
         """
         style = self.style
-        img = Image.new("RGBA", (max(2, int(width)), max(2, int(height))), (*style.bg, 255))
-        bg = self._safe_load_rgba(style.bg_image_path)
-        if bg:
-            bg_fit = self._fit_cover(bg, img.size[0], img.size[1])
-            img.alpha_composite(bg_fit, (0, 0))
-        return img
+        path = style.bg_image_path
+        size = (max(2, int(width)), max(2, int(height)))
+        mtime = _file_mtime(path)
+        # Stays RGBA: cards, stripes and panels write their translucent fills straight into the
+        # canvas (ImageDraw/paste replace RGBA pixels), and those alpha values end up in the PNG.
+        # An RGB canvas would flatten them to opaque colours and change the output.
+        if size[0] * size[1] > _BG_CACHE_MAX_PIXELS:
+            # too big to keep around; a fresh image is already the caller's own
+            return _bg_base.__wrapped__(path, mtime, size, style.bg)
+        # cached per (asset, size); callers draw on the result, so hand out a copy
+        return _bg_base(path, mtime, size, style.bg).copy()
 
     # -----------------------------
     # Shared "data prep" (no drawing)
@@ -119,7 +490,9 @@ class BracketDiagramRenderer:
         event_format: str,
         teams_by_seed: Mapping[int, Mapping[str, Any]],
         matches: list[Mapping[str, Any]],
-    ) -> tuple[dict[str, BracketNode], dict[int, int], int, int, int, bool, int]:
+    ) -> tuple[
+        dict[str, BracketNode], dict[int, int], int, int, int, bool, int, tuple[tuple[str, ...], ...], tuple[tuple[str, ...], ...]
+    ]:
         """
         Returns:
           nodes: code -> BracketNode (with seeds + team ids + winner ids + status)
@@ -129,6 +502,7 @@ class BracketDiagramRenderer:
           k (log2(bracket_size))
           is_double
           losers_rounds
+          w_codes / l_codes: _code_tables(bracket_size, is_double)
         """
         fmt = str(event_format or "").lower()
         is_double = fmt == EventFormat.DOUBLE.value
@@ -138,6 +512,7 @@ class BracketDiagramRenderer:
         k = int(log2(bracket_size))
 
         nodes: dict[str, BracketNode] = {}
+        w_codes, l_codes = _code_tables(bracket_size, is_double)
 
         # Winners bracket nodes
         for r in range(1, k + 1):
@@ -166,8 +541,7 @@ class BracketDiagramRenderer:
             seed1 = pos[i]
             seed2 = pos[i + 1]
             m_no = (i // 2) + 1
-            code = match_code("W", 1, m_no)
-            n = nodes.get(code)
+            n = nodes.get(w_codes[1][m_no])
             if n:
                 n.seed1 = seed1
                 n.seed2 = seed2
@@ -196,7 +570,7 @@ class BracketDiagramRenderer:
             w = row.get("winner_event_team_id")
             n.winner_event_team_id = int(w) if w is not None else None
 
-        return nodes, event_team_id_to_seed, team_count, bracket_size, k, is_double, losers_rounds
+        return nodes, event_team_id_to_seed, team_count, bracket_size, k, is_double, losers_rounds, w_codes, l_codes
 
     def _compute_wl(self, *, teams_by_seed: Mapping[int, Mapping[str, Any]], matches: list[Mapping[str, Any]]) -> dict[int, dict[str, int]]:
         """
@@ -236,6 +610,28 @@ class BracketDiagramRenderer:
             return parts[0], ""
         return "TBD", ""
 
+    def _prepare_team_labels(
+        self,
+        *,
+        teams_by_seed: Mapping[int, Mapping[str, Any]],
+        f_main: ImageFont.ImageFont,
+        w: int,
+        h: int,
+    ) -> dict[int, tuple[str, str]]:
+        """
+        seed -> (player 1, player 2) already fitted to a w x h card's name slots. A team shows up
+        on every card it plays, so the split + fit happens once per render instead of per card.
+        """
+        g = _card_geom(w, h)
+        max_text_w = (g.slot_dx1 - g.slot_dx0) - 14
+        labels: dict[int, tuple[str, str]] = {}
+        for seed, t in teams_by_seed.items():
+            if not t:
+                continue  # drawn as BYE/TBD, see _team_label_and_seed
+            p1, p2 = self._split_players(str(t.get("display_name") or t.get("name") or f"Seed {seed}"))
+            labels[int(seed)] = (_fit_text(p1, f_main, max_text_w), _fit_text(p2, f_main, max_text_w))
+        return labels
+
     def _team_label_and_seed(
         self,
         *,
@@ -271,7 +667,7 @@ class BracketDiagramRenderer:
     def _draw_match_card(
         self,
         *,
-        draw: ImageDraw.ImageDraw,
+        img: Image.Image,
         x: int,
         y: int,
         w: int,
@@ -286,137 +682,147 @@ class BracketDiagramRenderer:
         f_main: ImageFont.ImageFont,
         f_small: ImageFont.ImageFont,
         show_vs: bool = True,
+        labels: Mapping[int, tuple[str, str]] | None = None,
     ) -> None:
         """
         Draws a match card at pixel coords. Reused by full bracket and current-round view.
         Uses your existing style (incl seed badge). Orb is intentionally not drawn.
-        """
-        style = self.style
+        labels: _prepare_team_labels output; a seed found there is drawn from it as-is
+        (BYE/TBD slots aren't teams, so they're still split + fitted here).
 
-        # Local scale helper is unnecessary here (already pixels),
-        # but we still need consistent radii/widths. We derive from font size roughly.
-        # This stays stable across views.
-        radius = max(10, int(h * 0.06))
-        border_w = max(2, int(radius * 0.18))
-
-        header_h = max(26, int(h * 0.16))
-        inner_gap = max(8, int(h * 0.06))
-        team_h = (h - header_h - inner_gap) // 2
-
-        # card background (subtle gradient)
-        top = style.box_fill_top
-        bot = style.box_fill_bottom
-        bands = 10
-        for i in range(bands):
-            t = i / max(1, bands - 1)
-            col = (
-                int(top[0] * (1 - t) + bot[0] * t),
-                int(top[1] * (1 - t) + bot[1] * t),
-                int(top[2] * (1 - t) + bot[2] * t),
-                235,
+        Finished cards are cached on everything they show, so a card whose match hasn't changed
+        since the last render is a single paste. The card covers its whole (w+1)x(h+1) box and
+        is pasted unmasked, same as drawing it in place.
+        """
+        key = (w, h, header, top_text, top_seed, top_is_winner, bot_text, bot_seed, bot_is_winner, f_main, f_small, show_vs)
+        with self._card_cache_lock:
+            if self._card_cache_style is not self.style:
+                self._card_cache.clear()
+                self._card_cache_style = self.style
+            tile = self._card_cache.get(key)
+
+        if tile is None:
+            tile = self._render_card(
+                w=w,
+                h=h,
+                header=header,
+                top_text=top_text,
+                top_seed=top_seed,
+                top_is_winner=top_is_winner,
+                bot_text=bot_text,
+                bot_seed=bot_seed,
+                bot_is_winner=bot_is_winner,
+                f_main=f_main,
+                f_small=f_small,
+                show_vs=show_vs,
+                labels=labels,
             )
-            y0 = y + int((h * i) / bands)
-            y1 = y + int((h * (i + 1)) / bands)
-            draw.rectangle([x, y0, x + w, y1], fill=col)
-
-        # outer border + inner bevel
-        draw.rounded_rectangle([x, y, x + w, y + h], radius=radius, outline=(*style.box_border, 255), width=border_w)
-        draw.rounded_rectangle(
-            [x + border_w, y + border_w, x + w - border_w, y + h - border_w],
-            radius=max(6, radius - 1),
-            outline=(*style.box_inner_border, 255),
-            width=max(1, border_w // 2),
-        )
+            with self._card_cache_lock:
+                self._card_cache.set(key, tile)
+
+        img.paste(tile, (x, y))
 
-        # header strip
-        hx0, hy0, hx1, hy1 = x, y, x + w, y + header_h
-        draw.rectangle([hx0, hy0, hx1, hy1], fill=(8, 8, 10, 220))
-        draw.rectangle([hx0, hy0, hx1, hy1], outline=(*style.box_border, 220), width=max(1, border_w // 2))
+    def _render_card(
+        self,
+        *,
+        w: int,
+        h: int,
+        header: str,
+        top_text: str,
+        top_seed: Optional[int],
+        top_is_winner: bool,
+        bot_text: str,
+        bot_seed: Optional[int],
+        bot_is_winner: bool,
+        f_main: ImageFont.ImageFont,
+        f_small: ImageFont.ImageFont,
+        show_vs: bool,
+        labels: Mapping[int, tuple[str, str]] | None,
+    ) -> Image.Image:
+        # one match card as its own (w+1)x(h+1) image: chrome sprite + text.
+        # Cards aren't fanned out to a thread pool: ImageDraw shapes and FreeType text hold the
+        # GIL, so threads only add overhead here. Parallelism is per render, via the cog's worker
+        # threads; holding the GIL is also what lets them share the _load_font faces.
+        style = self.style
+        g = _card_geom(w, h)
+        team_h = g.team_h
 
-        # ember notch
-        notch_w = max(8, int(w * 0.02))
-        draw.rectangle([hx0, hy0, hx0 + notch_w, hy1], fill=(*style.ember, 140))
+        # all shapes come from the cached sprite; text goes on a copy
+        img = _card_chrome(w, h, style, top_seed is not None, top_is_winner, bot_seed is not None, bot_is_winner).copy()
+        draw = ImageDraw.Draw(img)
+        text = draw.text
+        textlen = draw.textlength
+        text_fill = style.text
+        name_dy = max(2, int((g.slot_h - (style.font_size * style.scale)) / 4))
+        slot_x0 = g.slot_dx0
+        max_text_w = (g.slot_dx1 - g.slot_dx0) - 14
 
         # header text
-        draw.text((x + max(10, int(w * 0.03)), y + max(3, int(header_h * 0.18))), header, font=f_small, fill=style.subtle)
-
-        def ellipsize(text: str, font: ImageFont.ImageFont, max_w: int) -> str:
-            t0 = (text or "").strip()
-            if not t0:
-                return ""
-            if draw.textlength(t0, font=font) <= max_w:
-                return t0
-            t = t0
-            while t and draw.textlength(t + "…", font=font) > max_w:
-                t = t[:-1]
-            return (t + "…") if t else "…"
+        text((max(10, int(w * 0.03)), max(3, int(g.header_h * 0.18))), header, font=f_small, fill=style.subtle)
 
         def draw_team_panel(py: int, team_text: str, seed_no: Optional[int], is_winner: bool) -> None:
-            # winner glow strip
-            if is_winner:
-                glow_h = max(6, int(team_h * 0.10))
-                draw.rectangle(
-                    [x + border_w, py + border_w, x + w - border_w, py + border_w + glow_h],
-                    fill=(*style.winner_gold, 85),
-                )
-
-            # seed badge (top-left)
+            # seed number on its badge
             if seed_no is not None:
-                badge_w = max(54, int(w * 0.13))
-                badge_h = max(24, int(team_h * 0.18))
-                bx0 = x + max(10, int(w * 0.03))
-                by0 = py + max(8, int(team_h * 0.08))
-                bx1 = bx0 + badge_w
-                by1 = by0 + badge_h
-                badge_fill = (*style.blood, 170) if not is_winner else (*style.winner_green, 170)
-                draw.rounded_rectangle([bx0, by0, bx1, by1], radius=max(8, badge_h // 2), fill=badge_fill, outline=(*style.box_border, 220), width=max(1, border_w // 2))
+                bx0 = g.badge_dx
+                by0 = py + g.badge_dy
                 seed_txt = f"#{int(seed_no)}"
-                tw = int(draw.textlength(seed_txt, font=f_small))
-                tx = bx0 + max(6, (badge_w - tw) // 2)
+                tw = int(textlen(seed_txt, font=f_small))
+                tx = bx0 + max(6, (g.badge_w - tw) // 2)
                 ty = by0 + 2
-                draw.text((tx, ty), seed_txt, font=f_small, fill=style.text)
-
-            # inner name slots (two lines)
-            slot_x0 = x + max(56, int(w * 0.14))
-            slot_x1 = x + w - max(18, int(w * 0.05))
-            slot_h = max(22, int(team_h * 0.28))
-            slot_gap = max(8, int(team_h * 0.08))
-
-            slot1_y0 = py + max(10, int((team_h - (2 * slot_h + slot_gap)) / 2))
-            slot2_y0 = slot1_y0 + slot_h + slot_gap
-
-            draw.rounded_rectangle([slot_x0, slot1_y0, slot_x1, slot1_y0 + slot_h], radius=max(8, slot_h // 3), fill=(10, 10, 12, 190))
-            draw.rounded_rectangle([slot_x0, slot2_y0, slot_x1, slot2_y0 + slot_h], radius=max(8, slot_h // 3), fill=(10, 10, 12, 190))
-            draw.rounded_rectangle([slot_x0, slot1_y0, slot_x1, slot1_y0 + slot_h], radius=max(8, slot_h // 3), outline=(*style.box_inner_border, 200), width=max(1, border_w // 2))
-            draw.rounded_rectangle([slot_x0, slot2_y0, slot_x1, slot2_y0 + slot_h], radius=max(8, slot_h // 3), outline=(*style.box_inner_border, 200), width=max(1, border_w // 2))
+                text((tx, ty), seed_txt, font=f_small, fill=text_fill)
 
             # names
-            p1, p2 = self._split_players(team_text)
-            max_text_w = (slot_x1 - slot_x0) - 14
-            p1 = ellipsize(p1, f_main, max_text_w)
-            p2 = ellipsize(p2, f_main, max_text_w)
+            fitted = labels.get(seed_no) if (labels is not None and seed_no is not None) else None
+            if fitted is not None:
+                p1, p2 = fitted
+            else:
+                p1, p2 = self._split_players(team_text)
+                p1 = _fit_text(p1, f_main, max_text_w)
+                p2 = _fit_text(p2, f_main, max_text_w)
 
             text_x = slot_x0 + 10
-            t1_y = slot1_y0 + max(2, int((slot_h - (self.style.font_size * self.style.scale)) / 4))
-            t2_y = slot2_y0 + max(2, int((slot_h - (self.style.font_size * self.style.scale)) / 4))
+            fill1 = text_fill if not is_winner else (255, 245, 225)
+            text((text_x, py + g.slot1_dy + name_dy), p1, font=f_main, fill=fill1)
+            text((text_x, py + g.slot2_dy + name_dy), p2, font=f_main, fill=text_fill)
 
-            fill1 = style.text if not is_winner else (255, 245, 225)
-            draw.text((text_x, t1_y), p1, font=f_main, fill=fill1)
-            draw.text((text_x, t2_y), p2, font=f_main, fill=style.text)
-
-        top_y = y + header_h
-        bot_y = top_y + team_h + inner_gap
+        top_y = g.header_h
+        bot_y = top_y + team_h + g.inner_gap
 
         draw_team_panel(top_y, top_text, top_seed, top_is_winner)
         draw_team_panel(bot_y, bot_text, bot_seed, bot_is_winner)
 
         if show_vs:
-            vs_y = top_y + team_h + (inner_gap // 2) - 10
-            draw.text((x + w - 46, vs_y), "VS", font=f_small, fill=style.subtle)
+            vs_y = top_y + team_h + (g.inner_gap // 2) - 10
+            text((w - 46, vs_y), "VS", font=f_small, fill=style.subtle)
+
+        return img
 
     # -----------------------------
     # Public: full bracket PNG (your existing output)
     # -----------------------------
+    def _png_input_key(
+        self,
+        kind: str,
+        event_id: int,
+        event_format: str,
+        title: str | None,
+        teams_by_seed: Mapping[int, Mapping[str, Any]],
+        matches: list[Mapping[str, Any]],
+        *view_args: Any,
+    ) -> tuple:
+        # exactly what the drawing reads: team name fields + MATCH_COLUMNS, in input order,
+        # plus the background's mtime so an edited asset isn't served from a stale PNG
+        return (
+            kind,
+            *view_args,
+            _file_mtime(self.style.bg_image_path),
+            event_id,
+            event_format,
+            title,
+            tuple((seed, t.get("event_team_id"), t.get("display_name"), t.get("name")) for seed, t in teams_by_seed.items()),
+            tuple(tuple(m.get(c) for c in MATCH_COLUMNS) for m in matches),
+        )
+
     def render_png(
         self,
         *,
@@ -426,7 +832,70 @@ class BracketDiagramRenderer:
         matches: list[Mapping[str, Any]],
         title: str | None = None,
     ) -> bytes:
-        nodes, event_team_id_to_seed, team_count, bracket_size, k, is_double, losers_rounds = self._build_nodes(
+        """
+        Full bracket PNG. The same inputs give the same bytes, so recent results are kept (see
+        PNG_CACHE_SIZE) and a repeat (e.g. a refresh with no new reports) skips drawing entirely.
+        """
+        key = self.bracket_png_key(
+            event_id=event_id, event_format=event_format, teams_by_seed=teams_by_seed, matches=matches, title=title
+        )
+        return self._cached_png(
+            key,
+            lambda: self._render_png(
+                event_id=event_id,
+                event_format=event_format,
+                teams_by_seed=teams_by_seed,
+                matches=matches,
+                title=title,
+            ),
+        )
+
+    def bracket_png_key(
+        self,
+        *,
+        event_id: int,
+        event_format: str,
+        teams_by_seed: Mapping[int, Mapping[str, Any]],
+        matches: list[Mapping[str, Any]],
+        title: str | None = None,
+    ) -> tuple:
+        """
+        PNG cache key for render_png with these arguments (see cached_png).
+        """
+        return self._png_input_key("bracket", event_id, event_format, title, teams_by_seed, matches)
+
+    def cached_png(self, key: tuple) -> bytes | None:
+        """
+        A PNG already rendered for key, or None. Doesn't draw, so it's cheap enough to call on
+        the event loop before handing a render to a worker thread.
+        """
+        with self._png_cache_lock:
+            if self._png_cache_style is not self.style:
+                self._png_cache.clear()
+                self._png_cache_style = self.style
+            return self._png_cache.get(key)
+
+    def _cached_png(self, key: tuple, render: Callable[[], bytes]) -> bytes:
+        png = self.cached_png(key)
+        if png is not None:
+            return png
+
+        png = render()
+        if len(png) <= self.PNG_CACHE_MAX_ITEM_BYTES:
+            with self._png_cache_lock:
+                self._png_cache.set(key, png)
+        return png
+
+    def _render_png(
+        self,
+        *,
+        event_id: int,
+        event_format: str,
+        teams_by_seed: Mapping[int, Mapping[str, Any]],
+        matches: list[Mapping[str, Any]],
+        title: str | None = None,
+    ) -> bytes:
+        nodes, event_team_id_to_seed, team_count, bracket_size, k, is_double, losers_rounds, w_codes, l_codes = self._build_nodes(
             event_format=event_format,
             teams_by_seed=teams_by_seed,
             matches=matches,
@@ -442,80 +911,9 @@ class BracketDiagramRenderer:
         h_gap_l, v_gap_l = style.h_gap, style.v_gap
         margin_l = style.margin
 
-        winners_xy: dict[str, tuple[int, int]] = {}
-        step = (box_h_l + v_gap_l) * 2
-
-        w1_count = bracket_size // 2
-        for m in range(1, w1_count + 1):
-            code = match_code("W", 1, m)
-            x = margin_l + 0 * (box_w_l + h_gap_l)
-            y = margin_l + (m - 1) * step
-            winners_xy[code] = (x, y)
-
-        for r in range(2, k + 1):
-            match_count = bracket_size // (2**r)
-            x = margin_l + (r - 1) * (box_w_l + h_gap_l)
-            for m in range(1, match_count + 1):
-                src1 = match_code("W", r - 1, 2 * m - 1)
-                src2 = match_code("W", r - 1, 2 * m)
-                y1 = winners_xy.get(src1, (0, margin_l))[1]
-                y2 = winners_xy.get(src2, (0, margin_l))[1]
-                y = (y1 + y2) // 2
-                winners_xy[match_code("W", r, m)] = (x, y)
-
-        max_wy = max(y for (_, y) in winners_xy.values()) if winners_xy else margin_l
-        winners_height = max_wy + box_h_l + margin_l
-
-        losers_xy: dict[str, tuple[int, int]] = {}
-        losers_offset_y = winners_height + 80
-        gf_xy: tuple[int, int] | None = None
-
-        if is_double and losers_rounds > 0:
-            for m in range(1, (bracket_size // 4) + 1):
-                w_src1 = match_code("W", 1, 2 * m - 1)
-                w_src2 = match_code("W", 1, 2 * m)
-                y1 = winners_xy.get(w_src1, (0, margin_l))[1]
-                y2 = winners_xy.get(w_src2, (0, margin_l))[1]
-                y = losers_offset_y + ((y1 + y2) // 2)
-                x = margin_l + 0 * (box_w_l + h_gap_l)
-                losers_xy[match_code("L", 1, m)] = (x, y)
-
-            for r in range(2, losers_rounds + 1):
-                stage = (r + 1) // 2
-                match_count = bracket_size // (2 ** (stage + 1))
-                x = margin_l + (r - 1) * (box_w_l + h_gap_l)
-
-                for m in range(1, match_count + 1):
-                    code = match_code("L", r, m)
-
-                    if r % 2 == 0:
-                        prev = match_code("L", r - 1, m)
-                        py = losers_xy.get(prev, (0, losers_offset_y + margin_l))[1]
-                        losers_xy[code] = (x, py)
-                    else:
-                        src1 = match_code("L", r - 1, 2 * m - 1)
-                        src2 = match_code("L", r - 1, 2 * m)
-                        y1 = losers_xy.get(src1, (0, losers_offset_y + margin_l))[1]
-                        y2 = losers_xy.get(src2, (0, losers_offset_y + margin_l))[1]
-                        y = (y1 + y2) // 2
-                        losers_xy[code] = (x, y)
-
-            gf_x = margin_l + (max(k, losers_rounds)) * (box_w_l + h_gap_l) + 40
-            w_final_y = winners_xy.get(match_code("W", k, 1), (0, margin_l))[1]
-            l_final_y = losers_xy.get(match_code("L", losers_rounds, 1), (0, losers_offset_y + margin_l))[1]
-            gf_y = (w_final_y + l_final_y) // 2
-            gf_xy = (gf_x, gf_y)
-
-        all_points = list(winners_xy.values())
-        if is_double and gf_xy is not None:
-            all_points += list(losers_xy.values())
-            all_points.append(gf_xy)
-
-        max_x = max(x for (x, _) in all_points) if all_points else margin_l
-        max_y = max(y for (_, y) in all_points) if all_points else margin_l
-
-        width_l = max_x + box_w_l + margin_l
-        height_l = max_y + box_h_l + margin_l
+        winners_xy, losers_xy, gf_xy, width_l, height_l = _bracket_layout(
+            bracket_size, is_double, box_w_l, box_h_l, h_gap_l, v_gap_l, margin_l
+        )
 
         width = max(2, S(width_l))
         height = max(2, S(height_l))
@@ -529,8 +927,14 @@ class BracketDiagramRenderer:
         # Helper for edges (scaled from logical to pixels)
         box_w = S(box_w_l)
         box_h = S(box_h_l)
+        labels = self._prepare_team_labels(teams_by_seed=teams_by_seed, f_main=f_main, w=box_w, h=box_h)
 
-        def draw_edge(src_xy_l: tuple[int, int], dst_xy_l: tuple[int, int]) -> None:
+        # Edges are collected as segments and drawn in one pass: a match's two feeder edges share
+        # their last segment, so it's rasterized once. A polyline without joints is drawn
+        # segment by segment anyway, so the pixels are the same.
+        segments: dict[tuple[tuple[int, int], tuple[int, int]], None] = {}
+
+        def add_edge(src_xy_l: tuple[int, int], dst_xy_l: tuple[int, int]) -> None:
             sx_l, sy_l = src_xy_l
             dx_l, dy_l = dst_xy_l
 
@@ -541,8 +945,11 @@ class BracketDiagramRenderer:
             d_mid = (dx, dy + box_h // 2)
 
             mid_x = (s_mid[0] + d_mid[0]) // 2
-            pts = [s_mid, (mid_x, s_mid[1]), (mid_x, d_mid[1]), d_mid]
-            draw.line(pts, fill=style.line, width=max(2, S(2)))
+            bend1 = (mid_x, s_mid[1])
+            bend2 = (mid_x, d_mid[1])
+            segments[(s_mid, bend1)] = None
+            segments[(bend1, bend2)] = None
+            segments[(bend2, d_mid)] = None
 
         # Title
         if title:
@@ -550,45 +957,35 @@ class BracketDiagramRenderer:
 
         # Edges
         for r in range(1, k):
-            match_count = bracket_size // (2**r)
-            for m in range(1, match_count + 1):
-                src = match_code("W", r, m)
-                dst = match_code("W", r + 1, (m + 1) // 2)
-                if src in winners_xy and dst in winners_xy:
-                    draw_edge(winners_xy[src], winners_xy[dst])
+            src_row, dst_row = winners_xy[r], winners_xy[r + 1]
+            for m in range(1, bracket_size // (2**r) + 1):
+                add_edge(src_row[m], dst_row[(m + 1) // 2])
 
         if is_double and gf_xy is not None and losers_rounds > 0:
+            w1, l1 = winners_xy[1], losers_xy[1]
             for m in range(1, (bracket_size // 2) + 1):
-                src = match_code("W", 1, m)
-                dst = match_code("L", 1, (m + 1) // 2)
-                if src in winners_xy and dst in losers_xy:
-                    draw_edge(winners_xy[src], losers_xy[dst])
+                add_edge(w1[m], l1[(m + 1) // 2])
 
             for r in range(2, k + 1):
+                src_row, dst_row = winners_xy[r], losers_xy[2 * (r - 1)]
                 for m in range(1, (bracket_size // (2**r)) + 1):
-                    src = match_code("W", r, m)
-                    dst = match_code("L", 2 * (r - 1), m)
-                    if src in winners_xy and dst in losers_xy:
-                        draw_edge(winners_xy[src], losers_xy[dst])
+                    add_edge(src_row[m], dst_row[m])
 
             for r in range(1, losers_rounds):
                 stage = (r + 1) // 2
                 match_count = bracket_size // (2 ** (stage + 1))
+                src_row, dst_row = losers_xy[r], losers_xy[r + 1]
                 for m in range(1, match_count + 1):
-                    src = match_code("L", r, m)
-                    if r % 2 == 1:
-                        dst = match_code("L", r + 1, m)
-                    else:
-                        dst = match_code("L", r + 1, (m + 1) // 2)
-                    if src in losers_xy and dst in losers_xy:
-                        draw_edge(losers_xy[src], losers_xy[dst])
-
-            w_final = match_code("W", k, 1)
-            l_final = match_code("L", losers_rounds, 1)
-            if w_final in winners_xy:
-                draw_edge(winners_xy[w_final], gf_xy)
-            if l_final in losers_xy:
-                draw_edge(losers_xy[l_final], gf_xy)
+                    add_edge(src_row[m], dst_row[m if r % 2 == 1 else (m + 1) // 2])
+
+            add_edge(winners_xy[k][1], gf_xy)
+            add_edge(losers_xy[losers_rounds][1], gf_xy)
+
+        line = draw.line
+        line_fill = style.line
+        line_w = max(2, S(2))
+        for seg in segments:
+            line(seg, fill=line_fill, width=line_w)
 
         # Boxes
         def draw_box(x_l: int, y_l: int, node: BracketNode) -> None:
@@ -617,7 +1014,7 @@ class BracketDiagramRenderer:
             bot_is_winner = (node.winner_event_team_id is not None and node.team2_event_team_id == node.winner_event_team_id)
 
             self._draw_match_card(
-                draw=draw,
+                img=img,
                 x=x,
                 y=y,
                 w=box_w,
@@ -632,18 +1029,23 @@ class BracketDiagramRenderer:
                 f_main=f_main,
                 f_small=f_small,
                 show_vs=True,
+                labels=labels,
             )
 
-        for code, (x_l, y_l) in winners_xy.items():
-            node = nodes.get(code)
-            if node:
-                draw_box(x_l, y_l, node)
+        for r in range(1, k + 1):
+            codes, row = w_codes[r], winners_xy[r]
+            for m in range(1, len(row)):
+                node = nodes.get(codes[m])
+                if node:
+                    draw_box(row[m][0], row[m][1], node)
 
         if is_double and gf_xy is not None:
-            for code, (x_l, y_l) in losers_xy.items():
-                node = nodes.get(code)
-                if node:
-                    draw_box(x_l, y_l, node)
+            for r in range(1, losers_rounds + 1):
+                codes, row = l_codes[r], losers_xy[r]
+                for m in range(1, len(row)):
+                    node = nodes.get(codes[m])
+                    if node:
+                        draw_box(row[m][0], row[m][1], node)
 
             gf_node = nodes.get("GF-01")
             if gf_node:
@@ -671,33 +1073,31 @@ class BracketDiagramRenderer:
         px1 = px0 + panel_w
         py1 = py0 + panel_h
 
-        draw.rounded_rectangle([px0, py0, px1, py1], radius=S(12), fill=(8, 8, 10, 205), outline=(*style.box_border, 230), width=max(2, S(2)))
-        draw.rounded_rectangle([px0 + S(2), py0 + S(2), px1 - S(2), py1 - S(2)], radius=S(11), outline=(*style.box_inner_border, 210), width=max(1, S(1)))
+        panel_fill = (8, 8, 10, 205)
+        draw.rounded_rectangle((px0, py0, px1, py1), radius=S(12), fill=panel_fill, outline=(*style.box_border, 230), width=max(2, S(2)))
+        draw.rounded_rectangle((px0 + S(2), py0 + S(2), px1 - S(2), py1 - S(2)), radius=S(11), outline=(*style.box_inner_border, 210), width=max(1, S(1)))
 
         draw.text((px0 + panel_pad, py0 + S(6)), "Teams", font=f_main, fill=style.text)
 
         hy = py0 + panel_pad + S(34)
         hx = px0 + panel_pad
-        draw.rectangle([px0 + S(6), hy - S(6), px1 - S(6), hy + row_h - S(4)], fill=(10, 10, 12, 190))
+        draw.rectangle((px0 + S(6), hy - S(6), px1 - S(6), hy + row_h - S(4)), fill=(10, 10, 12, 190))
         draw.text((hx + S(6), hy), "Seed", font=f_small, fill=style.subtle)
         draw.text((hx + col_seed + S(6), hy), "Team", font=f_small, fill=style.subtle)
         draw.text((hx + col_seed + col_team + S(6), hy), "Players", font=f_small, fill=style.subtle)
         draw.text((hx + col_seed + col_team + col_players + S(6), hy), "W-L", font=f_small, fill=style.subtle)
 
-        def ellipsize(text: str, font: ImageFont.ImageFont, max_w: int) -> str:
-            t = (text or "").strip()
-            if not t:
-                return ""
-            if draw.textlength(t, font=font) <= max_w:
-                return t
-            while t and draw.textlength(t + "…", font=font) > max_w:
-                t = t[:-1]
-            return (t + "…") if t else "…"
-
+        # one pass builds every column; each column is then drawn as one multiline_text call
+        seeds_col: list[str] = []
+        names_col: list[str] = []
+        players_col: list[str] = []
+        wl_col: list[str] = []
+        stripes: list[tuple[int, int]] = []  # (top, bottom) px rows, inclusive like draw.rectangle
         y = hy + row_h
         for seed in sorted(teams_by_seed.keys(), key=lambda z: int(z)):
             t = teams_by_seed.get(int(seed)) or {}
-            name = str(t.get("display_name") or t.get("name") or f"Seed {seed}")
+            # a newline inside a name would shift every row below it
+            name = str(t.get("display_name") or t.get("name") or f"Seed {seed}").replace("\n", " ")
             p1, p2 = self._split_players(name)
             players = (p1 + (" + " + p2 if p2 else "")).strip()
 
@@ -707,23 +1107,43 @@ class BracketDiagramRenderer:
                 st = stats.get(int(etid), {"w": 0, "l": 0})
                 wl = f"{st.get('w', 0)}-{st.get('l', 0)}"
 
-            seed_txt = f"#{int(seed)}"
-            name_fit = ellipsize(name, f_small, col_team - S(14))
-            players_fit = ellipsize(players, f_small, col_players - S(14))
+            seeds_col.append(f"#{int(seed)}")
+            names_col.append(_fit_text(name, f_small, col_team - S(14)))
+            players_col.append(_fit_text(players, f_small, col_players - S(14)))
+            wl_col.append(wl)
 
             if (int(seed) % 2) == 0:
-                draw.rectangle([px0 + S(6), y - S(2), px1 - S(6), y + row_h - S(2)], fill=(12, 10, 12, 140))
-
-            draw.text((hx + S(6), y), seed_txt, font=f_small, fill=style.text)
-            draw.text((hx + col_seed + S(6), y), name_fit, font=f_small, fill=style.text)
-            draw.text((hx + col_seed + col_team + S(6), y), players_fit, font=f_small, fill=style.text)
-            draw.text((hx + col_seed + col_team + col_players + S(6), y), wl, font=f_small, fill=style.text)
+                stripes.append((y - S(2), y + row_h - S(2)))
 
             y += row_h
 
-        buf = BytesIO()
-        img.save(buf, format="PNG", optimize=False)
-        return buf.getvalue()
+        if stripes:
+            # zebra stripes as one band: a column of stripe/panel-fill pixels stretched to the
+            # stripe width, pasted unmasked (rectangles replace pixels too). Between stripes it
+            # repeats the panel fill that is already there.
+            band_top = stripes[0][0]
+            column = [panel_fill] * (stripes[-1][1] - band_top + 1)
+            stripe_fill = (12, 10, 12, 140)
+            for top, bottom in stripes:
+                column[top - band_top : bottom - band_top + 1] = [stripe_fill] * (bottom - top + 1)
+            strip = Image.new("RGBA", (1, len(column)))
+            strip.putdata(column)
+            stripe_x0 = px0 + S(6)
+            img.paste(strip.resize(((px1 - S(6)) - stripe_x0 + 1, len(column)), Image.NEAREST), (stripe_x0, band_top))
+
+        if seeds_col:
+            # multiline_text advances each line by the height of "A" + spacing; make that row_h
+            row_y0 = hy + row_h
+            spacing = row_h - draw.textbbox((0, 0), "A", font=f_small)[3]
+            for col_x, lines in (
+                (hx + S(6), seeds_col),
+                (hx + col_seed + S(6), names_col),
+                (hx + col_seed + col_team + S(6), players_col),
+                (hx + col_seed + col_team + col_players + S(6), wl_col),
+            ):
+                draw.multiline_text((col_x, row_y0), "\n".join(lines), font=f_small, fill=style.text, spacing=spacing)
+
+        return self._png_bytes(img)
 
     # -----------------------------
     # Public: current round PNG (easy-to-read match cards)
@@ -749,7 +1169,62 @@ class BracketDiagramRenderer:
           - Reuses the same match-card renderer as the full bracket
         You can wire a new Discord command to call this method.
         """
-        nodes, event_team_id_to_seed, team_count, _bracket_size, _k, _is_double, _losers_rounds = self._build_nodes(
+        key = self.current_round_png_key(
+            event_id=event_id,
+            event_format=event_format,
+            teams_by_seed=teams_by_seed,
+            matches=matches,
+            title=title,
+            statuses=statuses,
+            max_cards=max_cards,
+            cards_per_row=cards_per_row,
+        )
+        return self._cached_png(
+            key,
+            lambda: self._render_current_round_png(
+                event_id=event_id,
+                event_format=event_format,
+                teams_by_seed=teams_by_seed,
+                matches=matches,
+                title=title,
+                statuses=statuses,
+                max_cards=max_cards,
+                cards_per_row=cards_per_row,
+            ),
+        )
+
+    def current_round_png_key(
+        self,
+        *,
+        event_id: int,
+        event_format: str,
+        teams_by_seed: Mapping[int, Mapping[str, Any]],
+        matches: list[Mapping[str, Any]],
+        title: str | None = None,
+        statuses: tuple[str, ...] = ("open", "pending"),
+        max_cards: int = 24,
+        cards_per_row: int | None = None,
+    ) -> tuple:
+        """
+        PNG cache key for render_current_round_png with these arguments (see cached_png).
+        """
+        return self._png_input_key(
+            "current_round", event_id, event_format, title, teams_by_seed, matches, statuses, max_cards, cards_per_row
+        )
+
+    def _render_current_round_png(
+        self,
+        *,
+        event_id: int,
+        event_format: str,
+        teams_by_seed: Mapping[int, Mapping[str, Any]],
+        matches: list[Mapping[str, Any]],
+        title: str | None,
+        statuses: tuple[str, ...],
+        max_cards: int,
+        cards_per_row: int | None,
+    ) -> bytes:
+        nodes, event_team_id_to_seed, team_count, _bracket_size, _k, _is_double, _losers_rounds, _w_codes, _l_codes = self._build_nodes(
             event_format=event_format,
             teams_by_seed=teams_by_seed,
             matches=matches,
@@ -807,9 +1282,7 @@ class BracketDiagramRenderer:
             msg_title = title or "Current Matches"
             draw.text((margin, margin), msg_title, font=f_main, fill=style.text)
             draw.text((margin, margin + int(46 * s)), "No active matches found.", font=f_small, fill=style.subtle)
-            buf = BytesIO()
-            img.save(buf, format="PNG", optimize=False)
-            return buf.getvalue()
+            return self._png_bytes(img)
 
         rows = int(ceil(n_cards / cards_per_row))
         width = margin * 2 + (cards_per_row * card_w) + ((cards_per_row - 1) * gap_x)
@@ -858,7 +1331,7 @@ class BracketDiagramRenderer:
             bot_is_winner = (node.winner_event_team_id is not None and node.team2_event_team_id == node.winner_event_team_id)
 
             self._draw_match_card(
-                draw=draw,
+                img=img,
                 x=x,
                 y=y,
                 w=card_w,
@@ -875,6 +1348,4 @@ class BracketDiagramRenderer:
                 show_vs=True,
             )
 
-        buf = BytesIO()
-        img.save(buf, format="PNG", optimize=False)
-        return buf.getvalue()
+        return self._png_bytes(img)
@@ -1,22 +1,10 @@
 # renderers/bracket_view.py
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from typing import Any, Mapping, Sequence
 
-
-def _json_obj(v: Any) -> dict:
-    if v is None:
-        return {}
-    if isinstance(v, dict):
-        return v
-    if isinstance(v, str):
-        try:
-            return json.loads(v)
-        except Exception:
-            return {}
-    return {}
+from utils.json_util import json_obj
 
 
 def _truncate(s: str, n: int) -> str:
@@ -103,7 +91,7 @@ class BracketView:
             return info.seed if info else None
 
         def match_code(m: Mapping[str, Any]) -> str:
-            md = _json_obj(m.get("metadata"))
+            md = json_obj(m.get("metadata"))
             c = md.get("code")
             if isinstance(c, str) and c.strip():
                 return c.strip().upper()
@@ -66,6 +66,23 @@ class Embeds:
         embed.add_field(name=name, value=value, inline=inline)
         return embed
 
+    def event_info(
+        self,
+        *,
+        event_id: int,
+        name: str,
+        status: str,
+        format: str,
+        team_size: int,
+        max_players: int,
+    ) -> discord.Embed:
+        e = self.info(title=f"Event {event_id}: {name}")
+        e.add_field(name="Status", value=status, inline=True)
+        e.add_field(name="Format", value=format, inline=True)
+        e.add_field(name="Team Size", value=f"{team_size}v{team_size}", inline=True)
+        e.add_field(name="Max Players", value=str(max_players), inline=True)
+        return e
+
     # -------------------------
     # Formatting helpers
     # -------------------------
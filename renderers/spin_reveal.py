@@ -93,5 +93,5 @@ class SpinRevealRenderer:
         )
 
         buf = BytesIO()
-        img.save(buf, format="PNG", optimize=False)
+        img.save(buf, format="PNG", optimize=False, compress_level=1)
         return buf.getvalue()
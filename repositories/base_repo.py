@@ -1,19 +1,31 @@
 # repositories/base_repo.py
 from __future__ import annotations
 
-import json
 from typing import Any, Iterable, Mapping, Sequence
 
-import aiomysql
-
 from db.pool import DbPool
 from db.tx import get_cursor, transaction
+from utils.json_util import json_dumps
 
 
 def to_json(v: Any) -> str | None:
     if v is None:
         return None
-    return json.dumps(v, separators=(",", ":"), ensure_ascii=False)
+    return json_dumps(v)
+
+
+def to_json_each(values: Iterable[Any]) -> list[str | None]:
+    """
+    to_json per value, serializing each distinct object once (bulk rows often share one metadata dict).
+    """
+    memo: dict[int, str | None] = {}
+    out: list[str | None] = []
+    for v in values:
+        k = id(v)
+        if k not in memo:
+            memo[k] = to_json(v)
+        out.append(memo[k])
+    return out
 
 
 class BaseRepo:
@@ -26,17 +38,30 @@ class BaseRepo:
         self._db = db
 
     @property
-    def pool(self) -> aiomysql.Pool:
-        return self._db.pool
+    def pool(self) -> DbPool:
+        # the DbPool itself (not the raw aiomysql pool) so checkouts go through its semaphore
+        return self._db
 
     async def fetch_one(self, sql: str, params: Sequence[Any] | None = None) -> Mapping[str, Any] | None:
         async with get_cursor(self.pool, dict_rows=True) as cur:
             await cur.execute(sql, params or ())
             return await cur.fetchone()
 
-    async def fetch_all(self, sql: str, params: Sequence[Any] | None = None) -> list[Mapping[str, Any]]:
-        async with get_cursor(self.pool, dict_rows=True) as cur:
+    async def fetch_all(
+        self,
+        sql: str,
+        params: Sequence[Any] | None = None,
+        *,
+        streaming: bool = False,
+    ) -> list[Mapping[str, Any]]:
+        """
+        streaming=True builds the list row by row from an unbuffered cursor, so the raw
+        buffered result and the dict rows are never held at the same time (larger result sets).
+        """
+        async with get_cursor(self.pool, dict_rows=True, streaming=streaming) as cur:
             await cur.execute(sql, params or ())
+            if streaming:
+                return [row async for row in cur]
             rows = await cur.fetchall()
             return list(rows or [])
 
@@ -2,9 +2,40 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
-from repositories.base_repo import BaseRepo, to_json
+from db.tx import transaction, transaction_bulk
+from domain.event_meta import EventMeta, to_event_meta
+from repositories.base_repo import BaseRepo, to_json, to_json_each
+
+
+# Posted image message refs kept in event.metadata as $.{kind}_image_channel_id / $.{kind}_image_message_id
+_IMAGE_REF_KINDS: frozenset[str] = frozenset({"bracket", "current_round"})
+
+
+_EVENT_TEAM_INSERT_SQL = """
+INSERT INTO event_team (event_id, base_team_id, display_name, seed, metadata)
+VALUES (%s, %s, %s, %s, %s);
+"""
+
+_EVENT_TEAM_MEMBER_UPSERT_SQL = """
+INSERT INTO event_team_member (event_team_id, account_id, role, slot, metadata)
+VALUES (%s, %s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE
+  role = VALUES(role),
+  slot = VALUES(slot),
+  metadata = COALESCE(VALUES(metadata), metadata);
+"""
+
+
+def _select_list(columns: Sequence[str] | None, *, default: str) -> str:
+    # column names are interpolated into SQL, so only plain identifiers are accepted
+    if not columns:
+        return default
+    for c in columns:
+        if not c.isidentifier():
+            raise ValueError(f"invalid column name: {c!r}")
+    return ", ".join(columns)
 
 
 class EventRepo(BaseRepo):
@@ -55,12 +86,56 @@ class EventRepo(BaseRepo):
             (event_id,),
         )
 
+    async def get_event_meta(self, *, event_id: int) -> EventMeta | None:
+        """
+        get_event parsed into EventMeta (normalized once, attribute access after).
+        """
+        row = await self.get_event(event_id=event_id)
+        return to_event_meta(row) if row else None
+
+    async def get_event_summary(self, *, event_id: int) -> Mapping[str, Any] | None:
+        """
+        Only the columns /event info shows (no rules/metadata JSON).
+        """
+        return await self.fetch_one(
+            """
+            SELECT name, status, format, team_size, max_players
+            FROM event
+            WHERE event_id=%s;
+            """,
+            (event_id,),
+        )
+
     async def set_event_status(self, *, event_id: int, status: str) -> int:
         return await self.execute(
             "UPDATE event SET status=%s, updated_at=NOW(6) WHERE event_id=%s;",
             (status, event_id),
         )
 
+    async def set_image_message_refs(self, *, event_id: int, refs: Mapping[str, tuple[int, int]]) -> int:
+        """
+        refs: kind -> (channel_id, message_id); every kind is written by a single JSON_SET UPDATE.
+        """
+        paths: list[str] = []
+        params: list[Any] = []
+        for kind, (channel_id, message_id) in refs.items():
+            if kind not in _IMAGE_REF_KINDS:
+                raise ValueError(f"unknown image kind: {kind!r}")
+            paths.append(f"'$.{kind}_image_channel_id', CAST(%s AS JSON), '$.{kind}_image_message_id', CAST(%s AS JSON)")
+            params += (int(channel_id), int(message_id))
+        if not paths:
+            return 0
+
+        params.append(int(event_id))
+        return await self.execute(
+            f"""
+            UPDATE event
+            SET metadata = JSON_SET(COALESCE(metadata, JSON_OBJECT()), {", ".join(paths)})
+            WHERE event_id = %s;
+            """,
+            params,
+        )
+
     async def register_player(self, *, event_id: int, account_id: int, metadata: Mapping[str, Any] | None = None) -> None:
         await self.execute(
             """
@@ -73,6 +148,34 @@ class EventRepo(BaseRepo):
             (event_id, account_id, to_json(metadata)),
         )
 
+    async def bulk_register_players(
+        self,
+        *,
+        event_id: int,
+        rows: Sequence[tuple[int, Mapping[str, Any] | None]],
+        trusted_ids: bool = False,
+    ) -> int:
+        """
+        rows: (account_id, metadata). Same upsert as register_player, sent as one multi-row INSERT.
+        trusted_ids=True skips per-row FK checks; only when the caller just created/verified
+        the event and every account_id.
+        """
+        if not rows:
+            return 0
+        sql = """
+            INSERT INTO event_registration (event_id, account_id, metadata)
+            VALUES (%s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+              status='active',
+              metadata = COALESCE(VALUES(metadata), metadata);
+            """
+        params = [(event_id, account_id, md_json) for (account_id, _md), md_json in zip(rows, to_json_each(md for _a, md in rows))]
+        if not trusted_ids:
+            return await self.execute_many(sql, params)
+        async with transaction_bulk(self.pool, dict_rows=False) as (_conn, cur):
+            await cur.executemany(sql, params)
+            return cur.rowcount
+
     async def drop_player(self, *, event_id: int, account_id: int) -> int:
         return await self.execute(
             """
@@ -83,16 +186,25 @@ class EventRepo(BaseRepo):
             (event_id, account_id),
         )
 
-    async def list_registrations(self, *, event_id: int) -> list[Mapping[str, Any]]:
+    async def list_registrations(self, *, event_id: int, status: str | None = None) -> list[Mapping[str, Any]]:
+        """
+        status narrows to one registration status (e.g. "active"); filtered and ordered
+        by ix_event_reg_status_joined (migration 005).
+        """
+        if status is None:
+            where, params = "er.event_id=%s", (event_id,)
+        else:
+            where, params = "er.event_id=%s AND er.status=%s", (event_id, status)
         return await self.fetch_all(
-            """
+            f"""
             SELECT er.account_id, er.status, er.joined_at, pa.display_name
             FROM event_registration er
             JOIN platform_account pa ON pa.account_id = er.account_id
-            WHERE er.event_id=%s
+            WHERE {where}
             ORDER BY er.joined_at ASC;
             """,
-            (event_id,),
+            params,
+            streaming=True,
         )
 
     async def create_event_team(
@@ -105,10 +217,7 @@ class EventRepo(BaseRepo):
         metadata: Mapping[str, Any] | None = None,
     ) -> int:
         return await self.insert_returning_id(
-            """
-            INSERT INTO event_team (event_id, base_team_id, display_name, seed, metadata)
-            VALUES (%s, %s, %s, %s, %s);
-            """,
+            _EVENT_TEAM_INSERT_SQL,
             (event_id, base_team_id, display_name, seed, to_json(metadata)),
         )
 
@@ -122,28 +231,98 @@ class EventRepo(BaseRepo):
         metadata: Mapping[str, Any] | None = None,
     ) -> None:
         await self.execute(
-            """
-            INSERT INTO event_team_member (event_team_id, account_id, role, slot, metadata)
-            VALUES (%s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE
-              role = VALUES(role),
-              slot = VALUES(slot),
-              metadata = COALESCE(VALUES(metadata), metadata);
-            """,
+            _EVENT_TEAM_MEMBER_UPSERT_SQL,
             (event_team_id, account_id, role, slot, to_json(metadata)),
         )
 
-    async def list_event_teams(self, *, event_id: int) -> list[Mapping[str, Any]]:
+    async def _insert_event_teams(
+        self,
+        cur: Any,
+        event_id: int,
+        teams: Sequence[tuple[str | None, int, Mapping[str, Any] | None]],
+    ) -> list[int]:
+        # One multi-row INSERT (executemany rewrites INSERT ... VALUES into a single statement), then
+        # ids resolved by seed. Not lastrowid + offset: with innodb_autoinc_lock_mode=2 (MySQL 8 default)
+        # a multi-row insert is not guaranteed a contiguous id range.
+        await cur.executemany(
+            _EVENT_TEAM_INSERT_SQL,
+            [(event_id, None, name, seed, md_json) for (name, seed, _md), md_json in zip(teams, to_json_each(t[2] for t in teams))],
+        )
+        await cur.execute(
+            "SELECT event_team_id, seed FROM event_team WHERE event_id=%s AND seed IS NOT NULL;",
+            (event_id,),
+        )
+        rows = await cur.fetchall()
+        id_by_seed = {int(r["seed"]): int(r["event_team_id"]) for r in rows or []}
+        return [id_by_seed[int(seed)] for (_name, seed, _md) in teams]
+
+    async def create_event_teams_with_members(
+        self,
+        *,
+        event_id: int,
+        teams: Sequence[tuple[str | None, int, Mapping[str, Any] | None, Sequence[tuple[int, str, int | None]]]],
+        status: str | None = None,
+        member_metadata: Mapping[str, Any] | None = None,
+    ) -> list[int]:
+        """
+        teams: (display_name, seed, metadata, members) with members as (account_id, role, slot).
+        member_metadata, if given, is stored on every member row.
+        Teams, members and (optionally) the event status land in one transaction:
+        all or nothing, four round-trips regardless of team count. Returns event_team_id in input order.
+        """
+        if not teams:
+            return []
+        member_md = to_json(member_metadata)
+        async with transaction(self.pool, dict_rows=True) as (_conn, cur):
+            team_ids = await self._insert_event_teams(cur, event_id, [(name, seed, md) for (name, seed, md, _m) in teams])
+            members = [
+                (event_team_id, account_id, role, slot, member_md)
+                for event_team_id, (_name, _seed, _md, team_members) in zip(team_ids, teams)
+                for (account_id, role, slot) in team_members
+            ]
+            if members:
+                await cur.executemany(_EVENT_TEAM_MEMBER_UPSERT_SQL, members)
+            if status is not None:
+                await cur.execute(
+                    "UPDATE event SET status=%s, updated_at=NOW(6) WHERE event_id=%s;",
+                    (status, event_id),
+                )
+        return team_ids
+
+    async def list_event_teams(
+        self,
+        *,
+        event_id: int,
+        columns: Sequence[str] | None = None,
+    ) -> list[Mapping[str, Any]]:
+        """
+        columns narrows the SELECT list (e.g. ("event_team_id", "display_name", "seed")).
+        """
+        cols = _select_list(columns, default="event_team_id, event_id, base_team_id, display_name, seed")
         return await self.fetch_all(
-            """
-            SELECT et.event_team_id, et.event_id, et.base_team_id, et.display_name, et.seed
-            FROM event_team et
-            WHERE et.event_id=%s
-            ORDER BY et.seed IS NULL, et.seed, et.event_team_id;
+            f"""
+            SELECT {cols}
+            FROM event_team
+            WHERE event_id=%s
+            ORDER BY seed IS NULL, seed, event_team_id;
             """,
             (event_id,),
         )
 
+    async def get_event_teams_by_ids(self, *, event_team_ids: Sequence[int]) -> list[Mapping[str, Any]]:
+        ids = [int(x) for x in event_team_ids if x is not None]
+        if not ids:
+            return []
+        placeholders = ",".join(["%s"] * len(ids))
+        return await self.fetch_all(
+            f"""
+            SELECT event_team_id, display_name, seed
+            FROM event_team
+            WHERE event_team_id IN ({placeholders});
+            """,
+            ids,
+        )
+
     async def get_event_team_roster(self, *, event_team_id: int) -> list[Mapping[str, Any]]:
         return await self.fetch_all(
             """
@@ -169,16 +348,37 @@ class EventRepo(BaseRepo):
         team1_event_team_id: int,
         team2_event_team_id: int | None,
         metadata: Mapping[str, Any] | None = None,
+        team1_seed: int | None = None,
+        team2_seed: int | None = None,
     ) -> int:
+        """
+        Seeds are denormalized onto the match; when not passed they are looked up
+        server-side in the same statement (no extra round trip).
+        """
         return await self.insert_returning_id(
             """
             INSERT INTO event_match
               (event_id, bracket, round_no, match_no,
-               team1_event_team_id, team2_event_team_id, metadata)
+               team1_event_team_id, team1_seed,
+               team2_event_team_id, team2_seed, metadata)
             VALUES
-              (%s, %s, %s, %s, %s, %s, %s);
+              (%s, %s, %s, %s,
+               %s, COALESCE(%s, (SELECT seed FROM event_team WHERE event_team_id=%s)),
+               %s, COALESCE(%s, (SELECT seed FROM event_team WHERE event_team_id=%s)), %s);
             """,
-            (event_id, bracket, round_no, match_no, team1_event_team_id, team2_event_team_id, to_json(metadata)),
+            (
+                event_id,
+                bracket,
+                round_no,
+                match_no,
+                team1_event_team_id,
+                team1_seed,
+                team1_event_team_id,
+                team2_event_team_id,
+                team2_seed,
+                team2_event_team_id,
+                to_json(metadata),
+            ),
         )
 
     async def get_match_by_code(self, *, event_id: int, match_code: str) -> Mapping[str, Any] | None:
@@ -239,10 +439,20 @@ class EventRepo(BaseRepo):
             (winner_event_team_id, loser_event_team_id, reported_by_account_id, to_json(metadata), event_match_id),
         )
 
-    async def list_matches(self, *, event_id: int) -> list[Mapping[str, Any]]:
+    async def list_matches(
+        self,
+        *,
+        event_id: int,
+        columns: Sequence[str] | None = None,
+    ) -> list[Mapping[str, Any]]:
+        """
+        columns narrows the SELECT list (renderers pass bracket_diagram.MATCH_COLUMNS);
+        default is every column, metadata included.
+        """
+        cols = _select_list(columns, default="*")
         return await self.fetch_all(
-            """
-            SELECT *
+            f"""
+            SELECT {cols}
             FROM event_match
             WHERE event_id=%s
             ORDER BY
@@ -250,6 +460,22 @@ class EventRepo(BaseRepo):
               round_no, match_no;
             """,
             (event_id,),
+            streaming=True,
+        )
+
+    async def list_match_refs(self, *, event_id: int) -> list[Mapping[str, Any]]:
+        """
+        Slim per-match projection (no metadata / timestamps) for code -> match lookups.
+        """
+        return await self.fetch_all(
+            """
+            SELECT event_match_id, bracket, round_no, match_no,
+                   team1_event_team_id, team1_seed,
+                   team2_event_team_id, team2_seed, status
+            FROM event_match
+            WHERE event_id=%s;
+            """,
+            (event_id,),
         )
 
     async def list_open_matches(self, *, event_id: int) -> list[Mapping[str, Any]]:
@@ -1,9 +1,34 @@
 # repositories/identity_repo.py
 from __future__ import annotations
 
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
-from repositories.base_repo import BaseRepo, to_json
+from db.tx import transaction
+from repositories.base_repo import BaseRepo, to_json, to_json_each
+
+
+# Discord account upsert; username = snowflake (see IdentityRepo docstring).
+# Kept in pieces so the bulk path can repeat the VALUES row: the NOW(6) defaults stop pymysql's
+# executemany from rewriting it into one multi-row statement on its own.
+_ACCOUNT_INSERT = """
+INSERT INTO platform_account
+  (platform_id, external_user_id, username, display_name, is_bot, is_mod, metadata, first_seen_at, last_seen_at)
+VALUES
+"""
+_ACCOUNT_ROW = "(%s, %s, %s, %s, %s, %s, %s, NOW(6), NOW(6))"
+_ACCOUNT_ON_DUPLICATE = """
+ON DUPLICATE KEY UPDATE
+  display_name = VALUES(display_name),
+  is_bot       = COALESCE(VALUES(is_bot), is_bot),
+  is_mod       = COALESCE(VALUES(is_mod), is_mod),
+  metadata     = COALESCE(VALUES(metadata), metadata),
+  last_seen_at = NOW(6);
+"""
+_UPSERT_ACCOUNT_SQL = _ACCOUNT_INSERT + _ACCOUNT_ROW + _ACCOUNT_ON_DUPLICATE
+
+
+def _flag(v: bool | None) -> int | None:
+    return 1 if v else 0 if v is not None else None
 
 
 class IdentityRepo(BaseRepo):
@@ -47,25 +72,14 @@ class IdentityRepo(BaseRepo):
 
         # Use snowflake for username to satisfy UNIQUE(platform_id, username)
         await self.execute(
-            """
-            INSERT INTO platform_account
-              (platform_id, external_user_id, username, display_name, is_bot, is_mod, metadata, first_seen_at, last_seen_at)
-            VALUES
-              (%s, %s, %s, %s, %s, %s, %s, NOW(6), NOW(6))
-            ON DUPLICATE KEY UPDATE
-              display_name = VALUES(display_name),
-              is_bot       = COALESCE(VALUES(is_bot), is_bot),
-              is_mod       = COALESCE(VALUES(is_mod), is_mod),
-              metadata     = COALESCE(VALUES(metadata), metadata),
-              last_seen_at = NOW(6);
-            """,
+            _UPSERT_ACCOUNT_SQL,
             (
                 platform_id,
                 snowflake,
                 snowflake,
                 display_name or snowflake,
-                1 if is_bot else 0 if is_bot is not None else None,
-                1 if is_mod else 0 if is_mod is not None else None,
+                _flag(is_bot),
+                _flag(is_mod),
                 to_json(metadata),
             ),
         )
@@ -78,6 +92,36 @@ class IdentityRepo(BaseRepo):
             raise RuntimeError("Failed to resolve account_id after upsert_discord_account()")
         return int(row["account_id"])
 
+    async def bulk_upsert_discord_accounts(
+        self,
+        rows: Sequence[tuple[int, str | None, bool | None, Mapping[str, Any] | None]],
+    ) -> dict[int, int]:
+        """
+        rows: (discord_user_id, display_name, is_bot, metadata).
+        One multi-row upsert + one IN-list SELECT in a single transaction (two round-trips).
+        Returns discord_user_id -> account_id.
+        """
+        if not rows:
+            return {}
+        platform_id = await self.ensure_discord_platform()
+        snowflakes = [str(r[0]) for r in rows]
+
+        params: list[Any] = []
+        for sf, md_json, (_uid, name, is_bot, _md) in zip(snowflakes, to_json_each(r[3] for r in rows), rows):
+            params += (platform_id, sf, sf, name or sf, _flag(is_bot), None, md_json)
+        values = ",\n".join([_ACCOUNT_ROW] * len(rows))
+
+        async with transaction(self.pool, dict_rows=True) as (_conn, cur):
+            await cur.execute(_ACCOUNT_INSERT + values + _ACCOUNT_ON_DUPLICATE, params)
+            placeholders = ",".join(["%s"] * len(snowflakes))
+            await cur.execute(
+                f"SELECT account_id, username FROM platform_account WHERE platform_id=%s AND username IN ({placeholders});",
+                (platform_id, *snowflakes),
+            )
+            found = await cur.fetchall()
+
+        return {int(r["username"]): int(r["account_id"]) for r in found or []}
+
     async def upsert_discord_channel(
         self,
         *,
@@ -189,3 +233,32 @@ class IdentityRepo(BaseRepo):
             """,
             (platform_id, snowflake),
         )
+
+    async def get_guild_announce_settings(self, *, guild_channel_id: int) -> Mapping[str, Any] | None:
+        """
+        Announce settings pulled out of channel.metadata server-side (no full JSON blob over the wire).
+        Values come back as strings (or NULL when unset).
+        """
+        return await self.fetch_one(
+            """
+            SELECT
+              NULLIF(JSON_UNQUOTE(JSON_EXTRACT(metadata, '$.announce_channel_id')), 'null') AS announce_channel_id,
+              NULLIF(JSON_UNQUOTE(JSON_EXTRACT(metadata, '$.announce_discord_id')), 'null') AS announce_discord_id
+            FROM channel
+            WHERE channel_id=%s;
+            """,
+            (guild_channel_id,),
+        )
+
+    async def merge_channel_metadata(self, *, channel_id: int, patch_json: str) -> int:
+        """
+        patch_json: already-serialized JSON object, merged with JSON_MERGE_PATCH semantics.
+        """
+        return await self.execute(
+            """
+            UPDATE channel
+            SET metadata = JSON_MERGE_PATCH(COALESCE(metadata, JSON_OBJECT()), %s)
+            WHERE channel_id=%s;
+            """,
+            (patch_json, channel_id),
+        )
@@ -1,9 +1,36 @@
 # repositories/team_repo.py
 from __future__ import annotations
 
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
-from repositories.base_repo import BaseRepo, to_json
+from db.tx import transaction
+from repositories.base_repo import BaseRepo, to_json, to_json_each
+
+
+_TEAM_INSERT_SQL = """
+INSERT INTO team
+  (guild_channel_id, context, name, tag, captain_account_id, metadata)
+VALUES
+  (%s, %s, %s, %s, %s, %s);
+"""
+
+_TEAM_MEMBER_UPSERT_SQL = """
+INSERT INTO team_member (team_id, account_id, role, slot, metadata)
+VALUES (%s, %s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE
+  role = VALUES(role),
+  slot = VALUES(slot),
+  metadata = COALESCE(VALUES(metadata), metadata);
+"""
+
+
+def _member_params(
+    team_id: int, rows: Sequence[tuple[int, str, int | None, Mapping[str, Any] | None]]
+) -> list[tuple[Any, ...]]:
+    return [
+        (team_id, account_id, role, slot, md_json)
+        for (account_id, role, slot, _md), md_json in zip(rows, to_json_each(r[3] for r in rows))
+    ]
 
 
 class TeamRepo(BaseRepo):
@@ -18,15 +45,35 @@ class TeamRepo(BaseRepo):
         metadata: Mapping[str, Any] | None = None,
     ) -> int:
         return await self.insert_returning_id(
-            """
-            INSERT INTO team
-              (guild_channel_id, context, name, tag, captain_account_id, metadata)
-            VALUES
-              (%s, %s, %s, %s, %s, %s);
-            """,
+            _TEAM_INSERT_SQL,
             (guild_channel_id, context, name, tag, captain_account_id, to_json(metadata)),
         )
 
+    async def create_team_with_members(
+        self,
+        *,
+        guild_channel_id: int,
+        context: str,
+        name: str,
+        tag: str | None = None,
+        captain_account_id: int | None = None,
+        metadata: Mapping[str, Any] | None = None,
+        members: Sequence[tuple[int, str, int | None, Mapping[str, Any] | None]] = (),
+    ) -> int:
+        """
+        create_team plus its roster in one transaction (no team without its roster); members are
+        sent as one multi-row INSERT of add_member's upsert. members: (account_id, role, slot, metadata).
+        """
+        async with transaction(self.pool, dict_rows=False) as (_conn, cur):
+            await cur.execute(
+                _TEAM_INSERT_SQL,
+                (guild_channel_id, context, name, tag, captain_account_id, to_json(metadata)),
+            )
+            team_id = int(cur.lastrowid)
+            if members:
+                await cur.executemany(_TEAM_MEMBER_UPSERT_SQL, _member_params(team_id, members))
+        return team_id
+
     async def get_team_by_name(self, *, guild_channel_id: int, context: str, name: str) -> Mapping[str, Any] | None:
         return await self.fetch_one(
             """
@@ -57,19 +104,7 @@ class TeamRepo(BaseRepo):
         slot: int | None = None,
         metadata: Mapping[str, Any] | None = None,
     ) -> None:
-        await self.execute(
-            """
-            INSERT INTO team_member
-              (team_id, account_id, role, slot, metadata)
-            VALUES
-              (%s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE
-              role = VALUES(role),
-              slot = VALUES(slot),
-              metadata = COALESCE(VALUES(metadata), metadata);
-            """,
-            (team_id, account_id, role, slot, to_json(metadata)),
-        )
+        await self.execute(_TEAM_MEMBER_UPSERT_SQL, (team_id, account_id, role, slot, to_json(metadata)))
 
     async def remove_member(self, *, team_id: int, account_id: int) -> int:
         return await self.execute(
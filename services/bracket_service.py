@@ -8,6 +8,7 @@ from typing import Any, List, Mapping, Optional, Tuple
 
 import aiomysql
 
+from domain.models import next_power_of_two, seeded_positions
 from repositories.event_repo import EventRepo
 
 
@@ -39,32 +40,6 @@ class MatchRef:
 MATCH_CODE_RE = re.compile(r"^(?:(GF)|([WL])(\d+))-(\d+)$", re.IGNORECASE)
 
 
-def next_power_of_two(n: int) -> int:
-    if n <= 1:
-        return 1
-    p = 1
-    while p < n:
-        p <<= 1
-    return p
-
-
-def seeded_positions(n: int) -> list[int]:
-    """
-    Standard tournament seed positions list (length n, n is power of two).
-    Example n=8 => [1,8,4,5,2,7,3,6]
-    """
-    if n <= 1:
-        return [1]
-    if n == 2:
-        return [1, 2]
-    prev = seeded_positions(n // 2)
-    out: list[int] = []
-    for s in prev:
-        out.append(s)
-        out.append(n + 1 - s)
-    return out
-
-
 def parse_match_code(code: str) -> tuple[str, int, int]:
     """
     Accepts:
@@ -205,6 +180,8 @@ class BracketService:
                 match_no=match_no,
                 team1_event_team_id=t1,
                 team2_event_team_id=t2,
+                team1_seed=seed1,
+                team2_seed=seed2,
                 metadata={
                     "generated": True,
                     "bracket_size": bracket_size,
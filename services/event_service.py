@@ -137,11 +137,11 @@ class EventService:
         if info.status not in ("draft", "open"):
             raise EventStatusError(f"Registration is closed (status '{info.status}')")
 
-        regs = await self._repo.list_registrations(event_id=event_id)
-        active_count = sum(1 for r in regs if (r.get("status") or "").lower() == "active")
+        regs = await self._repo.list_registrations(event_id=event_id, status="active")
+        active_count = len(regs)
 
         # If already active, no-op
-        already_active = any(int(r["account_id"]) == int(account_id) and (r.get("status") or "").lower() == "active" for r in regs)
+        already_active = any(int(r["account_id"]) == int(account_id) for r in regs)
         if already_active:
             return
 
@@ -158,8 +158,7 @@ class EventService:
         await self._repo.drop_player(event_id=event_id, account_id=account_id)
 
     async def list_active_registrations(self, *, event_id: int) -> list[Mapping[str, Any]]:
-        regs = await self._repo.list_registrations(event_id=event_id)
-        return [r for r in regs if (r.get("status") or "").lower() == "active"]
+        return await self._repo.list_registrations(event_id=event_id, status="active")
 
     # -------------------------
     # Team generation (randomized)
@@ -222,7 +221,7 @@ class EventService:
             raise EventTeamBuildError("Failed to form any teams from registrations.")
 
         # write teams in order; seed starts at 1
-        created_team_ids: list[int] = []
+        rows: list[tuple[str, int, Mapping[str, Any], list[tuple[int, str, int]]]] = []
         for idx, members in enumerate(teams, start=1):
             # Optional: prettier default name
             display_name = f"Team {idx}"
@@ -234,28 +233,16 @@ class EventService:
                 md["expected_team_size"] = info.team_size
                 md["actual_team_size"] = len(members)
 
-            event_team_id = await self._repo.create_event_team(
-                event_id=event_id,
-                base_team_id=None,
-                display_name=display_name,
-                seed=idx,
-                metadata=md,
-            )
-            created_team_ids.append(int(event_team_id))
-
-            # add members (starters only for now; backups can be added later)
-            for slot, account_id in enumerate(members, start=1):
-                await self._repo.add_event_team_member(
-                    event_team_id=event_team_id,
-                    account_id=account_id,
-                    role="starter",
-                    slot=slot,
-                    metadata={"source": "randomize"},
-                )
+            # starters only for now; backups can be added later
+            rows.append((display_name, idx, md, [(account_id, "starter", slot) for slot, account_id in enumerate(members, start=1)]))
 
-        # Lock event
-        await self.set_status(event_id=event_id, status="locked")
-        return created_team_ids
+        # teams, members and the lock in one transaction
+        return await self._repo.create_event_teams_with_members(
+            event_id=event_id,
+            teams=rows,
+            status="locked",
+            member_metadata={"source": "randomize"},
+        )
 
     async def get_event_teams_with_rosters(self, *, event_id: int) -> list[dict[str, Any]]:
         teams = await self._repo.list_event_teams(event_id=event_id)
@@ -8,6 +8,7 @@ from db.tx import transaction
 from repositories.event_repo import EventRepo
 from repositories.stats_repo import StatsRepo
 from services.bracket_service import BracketService
+from utils.json_util import json_dumps
 
 
 class StatsServiceError(Exception):
@@ -119,6 +120,7 @@ class StatsService:
         reported_by_account_id: Optional[int] = None,
         player_stats: Sequence[PlayerStatInput] | None = None,
         metadata: Optional[Mapping[str, Any]] = None,
+        match_row: Optional[Mapping[str, Any]] = None,
     ) -> int:
         """
         Atomically:
@@ -126,12 +128,19 @@ class StatsService:
           2) Upserts provided player stats lines
           3) Advances bracket (creates next matches if ready)
 
+        match_row: the caller's already-loaded row for this match (needs event_id, status,
+        team1_event_team_id, team2_event_team_id) to skip the re-read. The completing UPDATE is
+        guarded on status, so a row that went stale on status can't double-complete the match.
+
         Returns the event_id for convenience.
         """
-        m = await self._event_repo.fetch_one(
-            "SELECT * FROM event_match WHERE event_match_id=%s;",
-            (event_match_id,),
-        )
+        if match_row is not None and int(match_row["event_match_id"]) == int(event_match_id):
+            m = match_row
+        else:
+            m = await self._event_repo.fetch_one(
+                "SELECT * FROM event_match WHERE event_match_id=%s;",
+                (event_match_id,),
+            )
         if not m:
             raise MatchNotFoundError("Match not found.")
 
@@ -190,7 +199,7 @@ class StatsService:
                     w,
                     loser,
                     reported_by_account_id,
-                    (None if metadata is None else __import__("json").dumps(metadata, separators=(",", ":"), ensure_ascii=False)),
+                    (None if metadata is None else json_dumps(metadata)),
                     event_match_id,
                 ),
             )
@@ -220,7 +229,7 @@ class StatsService:
                             max(0, int(s.deaths)),
                             max(0, int(s.assists)),
                             1 if bool(s.participated) else 0,
-                            (None if s.metadata is None else __import__("json").dumps(s.metadata, separators=(",", ":"), ensure_ascii=False)),
+                            (None if s.metadata is None else json_dumps(s.metadata)),
                         ),
                     )
 
@@ -254,12 +263,12 @@ class StatsService:
     # -------------------------
 
     async def _maybe_update_event_status(self, event_id: int) -> None:
-        ev = await self._event_repo.get_event(event_id=event_id)
+        ev = await self._event_repo.get_event_meta(event_id=event_id)
         if not ev:
             return
 
-        fmt = str(ev.get("format") or "").lower()
-        status = str(ev.get("status") or "").lower()
+        fmt = ev.format
+        status = ev.status
 
         matches = await self._event_repo.list_matches(event_id=event_id)
         any_completed = any(str(m.get("status") or "").lower() == "completed" for m in matches)
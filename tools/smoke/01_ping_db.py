@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os, sys
-from dataclasses import asdict
 
 HERE = os.path.dirname(__file__)
 ROOT = os.path.abspath(os.path.join(HERE, "..", ".."))
@@ -24,7 +23,7 @@ async def main() -> None:
     cfg = load_config()
 
     db = DbPool()
-    await db.start(MySqlPoolConfig(**asdict(cfg.mysql)))
+    await db.start(MySqlPoolConfig.from_config(cfg.mysql))
     await db.ping()
     await db.close()
 
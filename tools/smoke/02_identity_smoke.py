@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os, sys
-from dataclasses import asdict
 from uuid import uuid4
 
 HERE = os.path.dirname(__file__)
@@ -31,7 +30,7 @@ async def main() -> None:
     user_id = int(os.getenv("SMOKE_USER_ID") or "999000111222333666")
 
     db = DbPool()
-    await db.start(MySqlPoolConfig(**asdict(cfg.mysql)))
+    await db.start(MySqlPoolConfig.from_config(cfg.mysql))
     repo = IdentityRepo(db)
 
     guild_channel_id = await repo.ensure_discord_guild(guild_id=guild_id, guild_name=f"SMOKE_GUILD_{run_id}")
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os, sys
-from dataclasses import asdict
 from uuid import uuid4
 
 HERE = os.path.dirname(__file__)
@@ -30,7 +29,7 @@ async def main() -> None:
     guild_id = int(os.getenv("SMOKE_GUILD_ID") or "999000111222333444")
 
     db = DbPool()
-    await db.start(MySqlPoolConfig(**asdict(cfg.mysql)))
+    await db.start(MySqlPoolConfig.from_config(cfg.mysql))
 
     ident = IdentityRepo(db)
     teams = TeamRepo(db)
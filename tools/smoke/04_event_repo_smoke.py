@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os, sys
-from dataclasses import asdict
 from uuid import uuid4
 
 HERE = os.path.dirname(__file__)
@@ -32,7 +31,7 @@ async def main() -> None:
     announce_channel_discord_id = int(os.getenv("SMOKE_TEXT_CHANNEL_ID") or "999000111222333555")
 
     db = DbPool()
-    await db.start(MySqlPoolConfig(**asdict(cfg.mysql)))
+    await db.start(MySqlPoolConfig.from_config(cfg.mysql))
 
     ident = IdentityRepo(db)
     events = EventRepo(db)
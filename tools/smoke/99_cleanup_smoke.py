@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os, sys
-from dataclasses import asdict
 
 HERE = os.path.dirname(__file__)
 ROOT = os.path.abspath(os.path.join(HERE, "..", ".."))
@@ -29,7 +28,7 @@ async def main() -> None:
         raise RuntimeError("Set SMOKE_RUN_ID to the run_id you want to clean up.")
 
     db = DbPool()
-    await db.start(MySqlPoolConfig(**asdict(cfg.mysql)))
+    await db.start(MySqlPoolConfig.from_config(cfg.mysql))
 
     # Delete in FK-safe order
     statements = [
@@ -0,0 +1,59 @@
+# utils/async_ttl_cache.py
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+from utils.cache import TTLCache
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING: Any = object()
+
+
+class AsyncTTLCache(Generic[K, V]):
+    """
+    TTLCache for awaited loads, with single-flight: concurrent misses on one key share one load.
+
+    - get_or_load(key, loader) returns the cached value or awaits loader() once for all waiters
+    - invalidate(key) drops the value and detaches any in-flight load, so a load that started
+      before a write can't store its (stale) result afterwards
+    - not thread-safe; meant for use on the bot's event loop
+    """
+
+    def __init__(self, *, maxsize: int = 256, ttl: Optional[float] = 3.0) -> None:
+        self._data: TTLCache[K, V] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: dict[K, asyncio.Future[V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        value = self._data.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(loader())
+            self._inflight[key] = fut
+            fut.add_done_callback(lambda f, key=key: self._settle(key, f))
+        # shield: one cancelled waiter must not cancel the load the others are waiting on
+        return await asyncio.shield(fut)
+
+    def _settle(self, key: K, fut: asyncio.Future[V]) -> None:
+        ok = not fut.cancelled() and fut.exception() is None  # also marks a failure as retrieved
+        if self._inflight.get(key) is not fut:
+            return  # invalidated while loading; don't store a pre-write result
+        del self._inflight[key]
+        if ok:
+            self._data.set(key, fut.result())
+
+    def invalidate(self, key: K) -> None:
+        self._data.invalidate(key)
+        self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._inflight.clear()
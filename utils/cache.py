@@ -0,0 +1,74 @@
+# utils/cache.py
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING: Any = object()
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Small in-process LRU cache with an optional per-entry TTL (monotonic clock).
+
+    - maxsize bounds memory (least-recently-used entry is evicted first)
+    - ttl=None means entries only leave via eviction/invalidate
+    - with a ttl, every 256th set() also drops expired entries from the cold end
+    - not thread-safe; meant for use on the bot's event loop
+    """
+
+    def __init__(self, *, maxsize: int = 1024, ttl: Optional[float] = None) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = int(maxsize)
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._sets = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K, default: Any = None) -> Any:
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING:
+            return default
+
+        expires_at, value = item
+        if expires_at and expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        expires_at = (time.monotonic() + self.ttl) if self.ttl else 0.0
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+        self._sets += 1
+        if self.ttl and not (self._sets & 0xFF):
+            self._sweep()
+
+    def _sweep(self) -> None:
+        # oldest entries sit at the front; stop at the first one still alive
+        now = time.monotonic()
+        data = self._data
+        while data:
+            key, (expires_at, _value) = next(iter(data.items()))
+            if expires_at > now:
+                break
+            del data[key]
+
+    def invalidate(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
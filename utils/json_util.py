@@ -0,0 +1,49 @@
+# utils/json_util.py
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# Optional C-accelerated JSON (falls back to stdlib json)
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def json_obj(v: Any) -> dict:
+    """
+    Parse a JSON column value into a dict.
+    Accepts None/str/bytes/dict; anything unparseable (or not an object) becomes {}.
+    """
+    if isinstance(v, dict):
+        return v  # usual case: the pool's JSON converter already decoded it
+    if not v or not isinstance(v, (str, bytes, bytearray)):
+        return {}
+
+    try:
+        out = orjson.loads(v) if orjson is not None else json.loads(v)
+    except Exception:
+        return {}
+    return out if isinstance(out, dict) else {}
+
+
+def json_loads(v: str | bytes) -> Any:
+    """
+    Decoder for MySQL JSON columns (registered on the DB pool).
+    Returns the raw value if it somehow isn't valid JSON, rather than failing the whole row.
+    """
+    try:
+        return orjson.loads(v) if orjson is not None else json.loads(v)
+    except Exception:
+        return v
+
+
+def json_dumps(v: Any) -> str:
+    """
+    Compact JSON text (no spaces, UTF-8 kept as-is).
+    Returned as str: MySQL rejects JSON built from binary-charset parameters.
+    """
+    if orjson is not None:
+        return orjson.dumps(v, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(v, separators=(",", ":"), ensure_ascii=False)